@@ -0,0 +1,83 @@
+"""Hash-partition global_votes on vn_id.
+
+global_votes is the largest import table and is read in full by CF training
+and the graph builder. Declarative HASH (vn_id) partitioning into 16 parts
+lets those scans run as parallel per-partition scans, and per-VN queries
+prune to a single partition.
+
+An existing table can't be converted in place, so the data is copied into a
+new partitioned table. global_votes_staging is recreated partitioned too:
+swap_staging_to_live() renames staging to live on every vote import, so both
+sides of the swap must share the layout. After a swap the live partitions
+carry the staging names (global_votes_staging_pN); only the names differ.
+
+The two secondary indexes are created on the partitioned parent, which
+cascades them to every partition.
+
+Revision ID: 037_partition_global_votes
+Revises: 036_ulist_vns_covering_idx
+"""
+
+from alembic import op
+
+revision = "037_partition_global_votes"
+down_revision = "036_ulist_vns_covering_idx"
+branch_labels = None
+depends_on = None
+
+PARTITIONS = 16
+
+COLUMNS = """
+    vn_id VARCHAR(10) NOT NULL{fk},
+    user_hash VARCHAR(64) NOT NULL,
+    vote INTEGER NOT NULL,
+    date DATE,
+    PRIMARY KEY (vn_id, user_hash)
+"""
+FK = " REFERENCES visual_novels(id) ON DELETE CASCADE"
+
+
+def _create_partitioned(table: str, fk: str) -> None:
+    op.execute(f"CREATE TABLE {table} ({COLUMNS.format(fk=fk)}) PARTITION BY HASH (vn_id)")
+    for i in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE {table}_p{i} PARTITION OF {table} "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {i})"
+        )
+
+
+def _create_plain(table: str, fk: str) -> None:
+    op.execute(f"CREATE TABLE {table} ({COLUMNS.format(fk=fk)})")
+
+
+def _rebuild(create) -> None:
+    # Move the current table (and the names of its PK/indexes) out of the way
+    op.execute("ALTER TABLE global_votes RENAME TO global_votes_old")
+    op.execute("ALTER TABLE global_votes_old DROP CONSTRAINT IF EXISTS global_votes_pkey")
+    op.execute("DROP INDEX IF EXISTS idx_global_votes_vn")
+    op.execute("DROP INDEX IF EXISTS idx_global_votes_user")
+
+    create("global_votes", FK)
+    op.execute("SET LOCAL maintenance_work_mem = '512MB'")
+    op.execute(
+        "INSERT INTO global_votes (vn_id, user_hash, vote, date) "
+        "SELECT vn_id, user_hash, vote, date FROM global_votes_old"
+    )
+    op.execute("DROP TABLE global_votes_old")
+    # Indexes after the bulk copy: one sort per partition instead of row-by-row
+    op.execute("CREATE INDEX idx_global_votes_vn ON global_votes (vn_id)")
+    op.execute("CREATE INDEX idx_global_votes_user ON global_votes (user_hash)")
+
+    # Staging only holds data mid-import; recreate it empty (no FK, no indexes)
+    op.execute("DROP TABLE IF EXISTS global_votes_staging")
+    create("global_votes_staging", "")
+
+    op.execute("ANALYZE global_votes")
+
+
+def upgrade() -> None:
+    _rebuild(_create_partitioned)
+
+
+def downgrade() -> None:
+    _rebuild(_create_plain)
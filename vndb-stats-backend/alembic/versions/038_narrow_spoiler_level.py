@@ -0,0 +1,36 @@
+"""Narrow spoiler_level columns from INTEGER to SMALLINT.
+
+spoiler_level only ever holds 0-2. vn_tags is the largest link table and
+carries spoiler_level in three composite indexes; character_traits and
+character_vn hold it once per row. SMALLINT is 2 bytes instead of 4 in the
+heap and every index that includes the column.
+
+The matching *_staging tables are narrowed as well: swap_staging_to_live()
+renames staging to live on each import, so both must share column types.
+
+Revision ID: 038_narrow_spoiler_level
+Revises: 037_partition_global_votes
+"""
+
+from alembic import op
+
+revision = "038_narrow_spoiler_level"
+down_revision = "037_partition_global_votes"
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    "vn_tags", "vn_tags_staging",
+    "character_traits", "character_traits_staging",
+    "character_vn", "character_vn_staging",
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE IF EXISTS {table} ALTER COLUMN spoiler_level TYPE SMALLINT")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE IF EXISTS {table} ALTER COLUMN spoiler_level TYPE INTEGER")
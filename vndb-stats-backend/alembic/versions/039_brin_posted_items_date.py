@@ -0,0 +1,30 @@
+"""Replace the posted_items_tracker.posted_at B-tree with a BRIN index.
+
+posted_items_tracker rows are inserted with posted_at = now(), so the column
+is physically ordered on disk, and its only query is the retention cleanup's
+`posted_at < cutoff` range delete. A BRIN index serves that with a handful of
+pages instead of a full B-tree entry per row.
+
+Revision ID: 039_brin_posted_items_date
+Revises: 038_narrow_spoiler_level
+"""
+
+from alembic import op
+
+revision = "039_brin_posted_items_date"
+down_revision = "038_narrow_spoiler_level"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_posted_items_date_brin "
+        "ON posted_items_tracker USING brin (posted_at) WITH (pages_per_range = 32)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_posted_items_date")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_posted_items_date ON posted_items_tracker (posted_at)")
+    op.execute("DROP INDEX IF EXISTS idx_posted_items_date_brin")
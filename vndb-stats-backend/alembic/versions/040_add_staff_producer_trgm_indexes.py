@@ -0,0 +1,50 @@
+"""Add pg_trgm GIN indexes for staff and producer name search.
+
+The browse staff/seiyuu/producer/publisher endpoints filter with
+ILIKE '%query%' on name and original, which the plain B-tree
+idx_staff_name / idx_producers_name cannot serve, so every search seq-scans
+the table. Same approach as 032 for VN titles and characters.
+
+Full-text tsvector columns were not added: search here is substring
+matching (including Japanese originals without word boundaries), which
+trigram indexes accelerate without changing results.
+
+Revision ID: 040_staff_producer_trgm
+Revises: 039_brin_posted_items_date
+"""
+
+from alembic import op
+
+revision = "040_staff_producer_trgm"
+down_revision = "039_brin_posted_items_date"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_staff_name_trgm "
+        "ON staff USING gin (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_staff_original_trgm "
+        "ON staff USING gin (original gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_producers_name_trgm "
+        "ON producers USING gin (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_producers_original_trgm "
+        "ON producers USING gin (original gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_producers_original_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_producers_name_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_staff_original_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_staff_name_trgm")
+    # Don't drop the extension - 032's indexes use it
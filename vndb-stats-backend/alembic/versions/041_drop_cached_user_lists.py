@@ -0,0 +1,39 @@
+"""Drop the deprecated cached_user_lists table.
+
+cached_user_lists held user lists fetched from the VNDB API before they came
+from the dumps (ulist_vns/ulist_labels). Nothing reads or writes it anymore;
+it only survived because user_stats_cache.vndb_uid had a foreign key into it.
+CASCADE drops that constraint too.
+
+The FK is not re-pointed at vndb_users: swap_staging_to_live() replaces
+vndb_users by renaming tables, so the constraint would follow the old table
+to vndb_users_staging and make its TRUNCATE fail on the next import.
+
+Revision ID: 041_drop_cached_user_lists
+Revises: 040_staff_producer_trgm
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "041_drop_cached_user_lists"
+down_revision = "040_staff_producer_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS cached_user_lists CASCADE")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "cached_user_lists",
+        sa.Column("vndb_uid", sa.String(20), primary_key=True),
+        sa.Column("username", sa.String(100)),
+        sa.Column("list_data", JSONB, nullable=False),
+        sa.Column("vote_data", JSONB),
+        sa.Column("fetched_at", sa.DateTime, nullable=False),
+        sa.Column("expires_at", sa.DateTime, nullable=False),
+    )
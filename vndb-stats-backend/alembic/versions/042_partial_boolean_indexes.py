@@ -0,0 +1,57 @@
+"""Replace full B-trees on boolean columns with partial indexes.
+
+A B-tree on a boolean (is_hidden, is_active, lie, patch, freeware) has two
+keys and is almost never chosen by the planner. The queries these were meant
+for all filter on the selective side of the flag, so index that side only:
+
+- news_items: public feeds filter is_hidden = false ordered by published_at
+- announcements: active announcements, checked against expires_at
+- vn_tags: per-tag lookups filter lie = false AND score > 0
+
+idx_releases_patch / idx_releases_freeware are dropped without replacement:
+the only patch filter runs after a release_vn -> releases PK join.
+
+Revision ID: 042_partial_boolean_indexes
+Revises: 041_drop_cached_user_lists
+"""
+
+from alembic import op
+
+revision = "042_partial_boolean_indexes"
+down_revision = "041_drop_cached_user_lists"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_news_visible_published "
+        "ON news_items (published_at DESC) WHERE NOT is_hidden"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_news_hidden")
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_announcements_live "
+        "ON announcements (expires_at) WHERE is_active"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_announcements_active")
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_vn_tags_tag_truth_score "
+        "ON vn_tags (tag_id, score) WHERE NOT lie AND score > 0"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_vn_tags_tag_lie")
+
+    op.execute("DROP INDEX IF EXISTS idx_releases_patch")
+    op.execute("DROP INDEX IF EXISTS idx_releases_freeware")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_releases_freeware ON releases (freeware)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_releases_patch ON releases (patch)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_vn_tags_tag_lie ON vn_tags (tag_id, lie)")
+    op.execute("DROP INDEX IF EXISTS idx_vn_tags_tag_truth_score")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_announcements_active ON announcements (is_active)")
+    op.execute("DROP INDEX IF EXISTS idx_announcements_live")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_news_hidden ON news_items (is_hidden)")
+    op.execute("DROP INDEX IF EXISTS idx_news_visible_published")
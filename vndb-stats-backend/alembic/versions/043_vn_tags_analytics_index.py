@@ -0,0 +1,41 @@
+"""Add a partial covering index for per-tag analytics on vn_tags.
+
+Tag analytics and per-tag VN lookups filter lie = false AND score > 0, then
+read vn_id, score and spoiler_level. (tag_id, vn_id) INCLUDE (score,
+spoiler_level) under that predicate answers them with an index-only scan.
+
+spoiler_level stays out of the WHERE clause: queries compare it against a
+bound parameter, which the planner cannot prove against a partial predicate
+under generic (prepared) plans, so the filter is applied from the INCLUDE
+column instead.
+
+This supersedes idx_vn_tags_tag_truth_score from 042 (same predicate, and
+(tag_id, vn_id) serves the same per-tag lookups).
+
+Revision ID: 043_vn_tags_analytics_idx
+Revises: 042_partial_boolean_indexes
+"""
+
+from alembic import op
+
+revision = "043_vn_tags_analytics_idx"
+down_revision = "042_partial_boolean_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_vn_tags_analytics "
+        "ON vn_tags (tag_id, vn_id) INCLUDE (score, spoiler_level) "
+        "WHERE NOT lie AND score > 0"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_vn_tags_tag_truth_score")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_vn_tags_tag_truth_score "
+        "ON vn_tags (tag_id, score) WHERE NOT lie AND score > 0"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_vn_tags_analytics")
@@ -0,0 +1,46 @@
+"""Drop single-column indexes duplicated by a composite's leading column.
+
+Each of these is the leftmost prefix of another index on the same table
+(and, for vn_tags/character_traits, of the primary key too), so the planner
+can use the composite for every lookup the single-column index served. They
+only cost write amplification during dump imports and buffer cache.
+
+    idx_vn_tags_vn             -> idx_vn_tags_vn_spoiler / PK (vn_id, tag_id)
+    idx_ulist_labels_uid       -> idx_ulist_labels_uid_label
+    idx_vn_staff_vn            -> idx_vn_staff_vn_role
+    idx_character_traits_char  -> idx_character_traits_char_spoiler
+    idx_release_vn_vn          -> idx_release_vn_vn_rtype
+    idx_news_source            -> idx_news_source_published
+
+swap_staging_to_live() copies whatever indexes the live table has, so the
+dropped ones are not recreated by the next import.
+
+Revision ID: 044_drop_prefix_dup_indexes
+Revises: 043_vn_tags_analytics_idx
+"""
+
+from alembic import op
+
+revision = "044_drop_prefix_dup_indexes"
+down_revision = "043_vn_tags_analytics_idx"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("idx_vn_tags_vn", "vn_tags", "vn_id"),
+    ("idx_ulist_labels_uid", "ulist_labels", "uid"),
+    ("idx_vn_staff_vn", "vn_staff", "vn_id"),
+    ("idx_character_traits_char", "character_traits", "character_id"),
+    ("idx_release_vn_vn", "release_vn", "vn_id"),
+    ("idx_news_source", "news_items", "source"),
+]
+
+
+def upgrade() -> None:
+    for name, _, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    for name, table, column in INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})")
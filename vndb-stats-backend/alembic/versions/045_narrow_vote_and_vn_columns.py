@@ -0,0 +1,49 @@
+"""Narrow global_votes.vote and small VN enums to SMALLINT; check vote range.
+
+global_votes.vote only holds 10-100 and is the widest remaining column in
+the largest table; SMALLINT halves it. The CHECK documents the range for the
+planner and guards the import, which now skips out-of-range votes.
+global_votes_staging gets the same type and constraint since the import swap
+renames it to live.
+
+visual_novels.length (1-5), minage (0-18) and devstatus (0-2) are narrowed
+as well; each is part of at least one index.
+
+Revision ID: 045_narrow_vote_vn_columns
+Revises: 044_drop_prefix_dup_indexes
+"""
+
+from alembic import op
+
+revision = "045_narrow_vote_vn_columns"
+down_revision = "044_drop_prefix_dup_indexes"
+branch_labels = None
+depends_on = None
+
+VOTE_TABLES = ["global_votes", "global_votes_staging"]
+VN_COLUMNS = ["length", "minage", "devstatus"]
+
+
+def upgrade() -> None:
+    for table in VOTE_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN vote TYPE SMALLINT")
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT ck_global_votes_vote_range "
+            "CHECK (vote BETWEEN 10 AND 100)"
+        )
+
+    op.execute(
+        "ALTER TABLE visual_novels "
+        + ", ".join(f"ALTER COLUMN {col} TYPE SMALLINT" for col in VN_COLUMNS)
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE visual_novels "
+        + ", ".join(f"ALTER COLUMN {col} TYPE INTEGER" for col in VN_COLUMNS)
+    )
+
+    for table in VOTE_TABLES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS ck_global_votes_vote_range")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN vote TYPE INTEGER")
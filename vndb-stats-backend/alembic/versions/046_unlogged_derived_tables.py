@@ -0,0 +1,40 @@
+"""Make precomputed/derived tables UNLOGGED.
+
+Similarities, co-occurrences, CF factors, tag vectors, graph embeddings and
+the per-user recommendation cache are all rebuilt wholesale from the base
+tables (TRUNCATE + COPY/INSERT) by the daily trainer. Writing WAL for them is
+pure overhead. UNLOGGED tables skip WAL; after a crash they come back empty
+until the next rebuild, which is acceptable for derived data.
+
+The similarity staging tables are included so the triple-rename swap keeps
+live and staging alike.
+
+Revision ID: 046_unlogged_derived_tables
+Revises: 045_narrow_vote_vn_columns
+"""
+
+from alembic import op
+
+revision = "046_unlogged_derived_tables"
+down_revision = "045_narrow_vote_vn_columns"
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    "vn_similarities", "vn_similarities_staging",
+    "vn_cooccurrence", "vn_cooccurrence_staging",
+    "user_recommendation_cache",
+    "tag_vn_vectors",
+    "cf_user_factors", "cf_vn_factors",
+    "user_graph_embeddings", "vn_graph_embeddings",
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE IF EXISTS {table} SET UNLOGGED")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE IF EXISTS {table} SET LOGGED")
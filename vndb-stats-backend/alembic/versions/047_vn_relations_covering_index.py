@@ -0,0 +1,34 @@
+"""Add a covering (vn_id, relation) index on vn_relations.
+
+The VN detail page and sequel/prequel lookups read every relation of one VN
+(optionally filtered by relation type) and need related_vn_id and official
+from each row. With INCLUDE (related_vn_id, official) these become index-only
+scans.
+
+idx_vn_relations_vn is dropped: vn_id is the leftmost column of both the
+primary key and the new index.
+
+Revision ID: 047_vn_relations_covering_idx
+Revises: 046_unlogged_derived_tables
+"""
+
+from alembic import op
+
+revision = "047_vn_relations_covering_idx"
+down_revision = "046_unlogged_derived_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_vn_relations_vn_rel "
+        "ON vn_relations (vn_id, relation) INCLUDE (related_vn_id, official)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_vn_relations_vn")
+    op.execute("ANALYZE vn_relations")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_vn_relations_vn ON vn_relations (vn_id)")
+    op.execute("DROP INDEX IF EXISTS idx_vn_relations_vn_rel")
@@ -0,0 +1,42 @@
+"""Move visual_novels / system_metadata timestamp defaults to the server.
+
+visual_novels.created_at/updated_at and system_metadata.updated_at had only
+Python-side defaults (datetime.utcnow), evaluated once per row for every
+multi-row VN upsert during imports, and skipped entirely by the raw-SQL
+system_metadata upserts (leaving updated_at NULL). A server default of
+timezone('utc', now()) is evaluated by Postgres and applies to every insert
+path.
+
+The columns stay timestamp without time zone: the application compares them
+against naive UTC datetimes, and switching to timestamptz would hand back
+aware values to that code.
+
+Revision ID: 048_utc_server_defaults
+Revises: 047_vn_relations_covering_idx
+"""
+
+from alembic import op
+
+revision = "048_utc_server_defaults"
+down_revision = "047_vn_relations_covering_idx"
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ("visual_novels", "created_at"),
+    ("visual_novels", "updated_at"),
+    ("system_metadata", "updated_at"),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"SET DEFAULT timezone('utc', now())"
+        )
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
@@ -0,0 +1,50 @@
+"""Index VN alias search with pg_trgm via an IMMUTABLE wrapper function.
+
+The browse search ORs ILIKE '%q%' over title, title_jp, title_romaji and
+aliases (plus normalized variants). 032 indexed everything except aliases,
+because array_to_string() is STABLE and cannot appear in an index
+expression - and a single unindexable OR arm makes the planner fall back to
+a sequential scan for the whole filter.
+
+vn_aliases_text(text[]) wraps array_to_string(COALESCE(aliases, '{}'), ' ')
+as IMMUTABLE (true for text[], whose element output never depends on
+settings). The search query now calls it, so both alias arms match these
+trigram indexes and the OR can be answered with a BitmapOr.
+
+Plain GIN (array_ops) indexes on the alias arrays were not added: nothing
+queries aliases by containment, and they would not serve substring search.
+
+Revision ID: 049_vn_aliases_trgm
+Revises: 048_utc_server_defaults
+"""
+
+from alembic import op
+
+revision = "049_vn_aliases_trgm"
+down_revision = "048_utc_server_defaults"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE OR REPLACE FUNCTION vn_aliases_text(text[]) RETURNS text "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE "
+        "AS $$ SELECT array_to_string(COALESCE($1, '{}'::text[]), ' ') $$"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_vn_aliases_trgm "
+        "ON visual_novels USING gin (vn_aliases_text(aliases) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_vn_aliases_norm_trgm "
+        "ON visual_novels USING gin ("
+        "lower(regexp_replace(vn_aliases_text(aliases), '[^a-zA-Z0-9]', '', 'g')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_vn_aliases_norm_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_vn_aliases_trgm")
+    op.execute("DROP FUNCTION IF EXISTS vn_aliases_text(text[])")
@@ -0,0 +1,44 @@
+"""Composite indexes for the app_logs dedup lookup and recent-errors widget.
+
+Frontend error dedup looks up the newest row for an error_hash within the
+last hour; (error_hash, timestamp DESC) answers that with one index descent
+instead of walking every row with the hash and filtering on timestamp.
+
+The log stats "recent errors" query filters on level and orders by
+timestamp DESC with a LIMIT; (level, timestamp DESC) returns the rows in
+order, so no sort is needed. It replaces idx_app_logs_level, which is its
+leftmost prefix. The single-column error_hash index (idx_app_logs_error_hash
+from 007, ix_app_logs_error_hash on create_all databases) is dropped for the
+same reason.
+
+Revision ID: 050_app_logs_composite_idx
+Revises: 049_vn_aliases_trgm
+"""
+
+from alembic import op
+
+revision = "050_app_logs_composite_idx"
+down_revision = "049_vn_aliases_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_app_logs_hash_timestamp "
+        "ON app_logs (error_hash, timestamp DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_app_logs_level_timestamp "
+        "ON app_logs (level, timestamp DESC)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_app_logs_error_hash")
+    op.execute("DROP INDEX IF EXISTS ix_app_logs_error_hash")
+    op.execute("DROP INDEX IF EXISTS idx_app_logs_level")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_app_logs_level ON app_logs (level)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_app_logs_error_hash ON app_logs (error_hash)")
+    op.execute("DROP INDEX IF EXISTS idx_app_logs_level_timestamp")
+    op.execute("DROP INDEX IF EXISTS idx_app_logs_hash_timestamp")
@@ -0,0 +1,36 @@
+"""Partial indexes for active import runs and per-run import errors.
+
+The admin dashboard polls for the running import every few seconds.
+idx_import_runs_active only holds runs with a non-terminal status (normally
+zero or one row), so the poll never touches the historical runs.
+
+idx_import_logs_run_errors holds only ERROR rows keyed by (run_id,
+timestamp), which is the filter and order the log viewer uses when showing
+the errors for one run.
+
+Revision ID: 051_import_partial_indexes
+Revises: 050_app_logs_composite_idx
+"""
+
+from alembic import op
+
+revision = "051_import_partial_indexes"
+down_revision = "050_app_logs_composite_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_import_runs_active "
+        "ON import_runs (started_at DESC) WHERE status IN ('running', 'pending')"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_import_logs_run_errors "
+        "ON import_logs (run_id, timestamp) WHERE level = 'ERROR'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_import_logs_run_errors")
+    op.execute("DROP INDEX IF EXISTS idx_import_runs_active")
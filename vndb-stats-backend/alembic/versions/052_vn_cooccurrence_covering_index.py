@@ -0,0 +1,39 @@
+"""Make idx_vn_cooccur_score covering and drop idx_vn_cooccur_vn.
+
+"Users also read" lookups read vn_cooccurrence by vn_id ordered by
+co_rating_score DESC and need similar_vn_id and user_count from each row.
+INCLUDE (similar_vn_id, user_count) turns them into index-only scans.
+idx_vn_cooccur_vn is the leftmost prefix of the same index (and of the
+primary key).
+
+The trainer rebuilds these indexes on the staging table before every swap
+(swap_similarity_tables), so this only brings the current live table in
+line until the next training run.
+
+Revision ID: 052_vn_cooccur_covering_idx
+Revises: 051_import_partial_indexes
+"""
+
+from alembic import op
+
+revision = "052_vn_cooccur_covering_idx"
+down_revision = "051_import_partial_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_vn_cooccur_score")
+    op.execute(
+        "CREATE INDEX idx_vn_cooccur_score ON vn_cooccurrence "
+        "(vn_id, co_rating_score DESC) INCLUDE (similar_vn_id, user_count)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_vn_cooccur_vn")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_vn_cooccur_vn ON vn_cooccurrence (vn_id)")
+    op.execute("DROP INDEX IF EXISTS idx_vn_cooccur_score")
+    op.execute(
+        "CREATE INDEX idx_vn_cooccur_score ON vn_cooccurrence (vn_id, co_rating_score DESC)"
+    )
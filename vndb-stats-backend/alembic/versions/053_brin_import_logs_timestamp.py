@@ -0,0 +1,33 @@
+"""Replace the import_logs.timestamp B-tree with a BRIN index.
+
+import_logs is append-only with timestamp = now(), so rows are physically in
+timestamp order. The admin log viewer reads a run's logs through run_id, so
+the timestamp index only serves time-range scans, which a BRIN index answers
+from a few summary pages at a fraction of the B-tree's size and insert cost.
+
+app_logs keeps its B-tree: the log browser pages with ORDER BY timestamp
+DESC LIMIT n, which needs an ordered index.
+
+Revision ID: 053_brin_import_logs_ts
+Revises: 052_vn_cooccur_covering_idx
+"""
+
+from alembic import op
+
+revision = "053_brin_import_logs_ts"
+down_revision = "052_vn_cooccur_covering_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_import_logs_timestamp_brin "
+        "ON import_logs USING brin (timestamp) WITH (pages_per_range = 32)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_import_logs_timestamp")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_import_logs_timestamp ON import_logs (timestamp)")
+    op.execute("DROP INDEX IF EXISTS idx_import_logs_timestamp_brin")
@@ -0,0 +1,33 @@
+"""Store app_logs.error_hash as a 16-byte bytea instead of hex text.
+
+The dedup hash is the first 128 bits of a SHA-256 digest, previously kept as
+32 hex characters in a varchar(64). Storing the raw bytes halves the key
+width of idx_app_logs_hash_timestamp (the dedup lookup on every flush of
+frontend error reports). 128 bits is ample for grouping error reports.
+
+ALTER COLUMN ... TYPE rebuilds the index on the new type.
+
+Revision ID: 054_app_logs_error_hash_bytea
+Revises: 053_brin_import_logs_ts
+"""
+
+from alembic import op
+
+revision = "054_app_logs_error_hash_bytea"
+down_revision = "053_brin_import_logs_ts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE app_logs ALTER COLUMN error_hash TYPE bytea "
+        "USING decode(left(error_hash, 32), 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE app_logs ALTER COLUMN error_hash TYPE varchar(64) "
+        "USING encode(error_hash, 'hex')"
+    )
@@ -0,0 +1,96 @@
+"""Range-partition app_logs by day on timestamp.
+
+app_logs keeps 30 days of backend and frontend logs, and the daily cleanup
+used to DELETE the expired rows: a large write every day that left dead
+tuples and index bloat for autovacuum. With daily partitions the cleanup job
+(app.logging.cleanup) drops expired partitions whole and creates the
+upcoming ones; time-window reads (the log browser, stats) prune to the
+partitions they need. A DEFAULT partition catches anything outside the
+daily ranges.
+
+The primary key becomes (id, timestamp), since a partitioned table's unique
+constraints must include the partition key; ids still come from the
+existing app_logs_id_seq. Existing rows are copied into the new table (the
+ones older than the created partitions go to the default partition and are
+removed by the next cleanup).
+
+correlation_id is added first if missing: the model has it but no earlier
+migration did.
+
+import_logs is not partitioned: it has no retention job and hangs off
+import_runs through an FK.
+
+Revision ID: 055_partition_app_logs
+Revises: 054_app_logs_error_hash_bytea
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from alembic import op
+
+revision = "055_partition_app_logs"
+down_revision = "054_app_logs_error_hash_bytea"
+branch_labels = None
+depends_on = None
+
+DAYS_BACK = 30
+DAYS_AHEAD = 7
+
+INDEXES = [
+    "CREATE INDEX idx_app_logs_timestamp ON app_logs (timestamp DESC)",
+    "CREATE INDEX idx_app_logs_source_level ON app_logs (source, level)",
+    "CREATE INDEX idx_app_logs_level_timestamp ON app_logs (level, timestamp DESC)",
+    "CREATE INDEX idx_app_logs_source ON app_logs (source)",
+    "CREATE INDEX idx_app_logs_hash_timestamp ON app_logs (error_hash, timestamp DESC)",
+    "CREATE INDEX ix_app_logs_correlation_id ON app_logs (correlation_id)",
+]
+INDEX_NAMES = [
+    "idx_app_logs_timestamp", "idx_app_logs_source_level", "idx_app_logs_level_timestamp",
+    "idx_app_logs_source", "idx_app_logs_hash_timestamp", "ix_app_logs_correlation_id",
+]
+
+
+def _move_old_table_aside() -> None:
+    op.execute("ALTER TABLE app_logs RENAME TO app_logs_old")
+    op.execute("ALTER TABLE app_logs_old DROP CONSTRAINT IF EXISTS app_logs_pkey")
+    for name in INDEX_NAMES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _copy_and_finish() -> None:
+    # The serial's sequence is owned by the old column; re-home it before the
+    # old table (and with it the sequence) is dropped
+    op.execute("ALTER SEQUENCE app_logs_id_seq OWNED BY app_logs.id")
+    op.execute("INSERT INTO app_logs SELECT * FROM app_logs_old")
+    op.execute("DROP TABLE app_logs_old")
+    for ddl in INDEXES:
+        op.execute(ddl)
+    op.execute("ANALYZE app_logs")
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE app_logs ADD COLUMN IF NOT EXISTS correlation_id VARCHAR(64)")
+    _move_old_table_aside()
+
+    op.execute(
+        "CREATE TABLE app_logs (LIKE app_logs_old INCLUDING DEFAULTS, "
+        "PRIMARY KEY (id, timestamp)) PARTITION BY RANGE (timestamp)"
+    )
+    op.execute("CREATE TABLE app_logs_default PARTITION OF app_logs DEFAULT")
+    today = datetime.now(timezone.utc).date()
+    for offset in range(-DAYS_BACK, DAYS_AHEAD + 1):
+        day = today + timedelta(days=offset)
+        op.execute(
+            f"CREATE TABLE app_logs_p{day:%Y%m%d} PARTITION OF app_logs "
+            f"FOR VALUES FROM ('{day.isoformat()} 00:00:00+00') "
+            f"TO ('{(day + timedelta(days=1)).isoformat()} 00:00:00+00')"
+        )
+    _copy_and_finish()
+
+
+def downgrade() -> None:
+    _move_old_table_aside()
+    op.execute(
+        "CREATE TABLE app_logs (LIKE app_logs_old INCLUDING DEFAULTS, PRIMARY KEY (id))"
+    )
+    _copy_and_finish()
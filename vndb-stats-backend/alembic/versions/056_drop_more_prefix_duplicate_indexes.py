@@ -0,0 +1,34 @@
+"""Drop two more single-column indexes duplicated by a composite's prefix.
+
+    idx_user_rec_user    -> idx_user_rec_score (user_id, combined_score DESC) / PK
+    idx_app_logs_source  -> idx_app_logs_source_level (source, level)
+
+Same reasoning as 044: the composite serves every lookup the single-column
+index did, so the copy only costs writes and cache. (idx_vn_cooccur_vn went
+in 052.)
+
+Revision ID: 056_drop_more_prefix_dups
+Revises: 055_partition_app_logs
+"""
+
+from alembic import op
+
+revision = "056_drop_more_prefix_dups"
+down_revision = "055_partition_app_logs"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("idx_user_rec_user", "user_recommendation_cache", "user_id"),
+    ("idx_app_logs_source", "app_logs", "source"),
+]
+
+
+def upgrade() -> None:
+    for name, _, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    for name, table, column in INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})")
@@ -0,0 +1,32 @@
+"""Make idx_blacklist_config_active a partial index over active rules.
+
+The auto-blacklist evaluator and the admin stats only ever ask for
+is_active = true. A B-tree over the boolean itself holds every rule and is
+too unselective to be chosen; a partial index on id WHERE is_active holds
+just the active rules.
+
+Revision ID: 057_blacklist_active_partial
+Revises: 056_drop_more_prefix_dups
+"""
+
+from alembic import op
+
+revision = "057_blacklist_active_partial"
+down_revision = "056_drop_more_prefix_dups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_blacklist_config_active")
+    op.execute(
+        "CREATE INDEX idx_blacklist_config_active "
+        "ON cover_blacklist_config (id) WHERE is_active"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_blacklist_config_active")
+    op.execute(
+        "CREATE INDEX idx_blacklist_config_active ON cover_blacklist_config (is_active)"
+    )
@@ -111,7 +111,10 @@ async def get_import_status(db: AsyncSession = Depends(get_db)):
     """Get current import status and last completed run."""
     # Current running import
     result = await db.execute(
-        select(ImportRun).where(ImportRun.status == "running").limit(1)
+        select(ImportRun)
+        .where(ImportRun.status == "running")
+        .order_by(desc(ImportRun.started_at))
+        .limit(1)
     )
     current = result.scalar_one_or_none()
 
@@ -81,14 +81,14 @@ class TagSearchResult(BaseModel):
 
 # ==================== Helper Functions ====================
 
-async def _get_tag_names(db: AsyncSession, tag_ids: list[int] | None) -> list[str]:
-    """Get tag names for a list of tag IDs."""
+async def _get_tag_name_map(db: AsyncSession, tag_ids: set[int]) -> dict[int, str]:
+    """Get tag names for a set of tag IDs in one query."""
     if not tag_ids:
-        return []
+        return {}
     result = await db.execute(
-        select(Tag.name).where(Tag.id.in_(tag_ids))
+        select(Tag.id, Tag.name).where(Tag.id.in_(tag_ids))
     )
-    return [row[0] for row in result.all()]
+    return dict(result.all())
 
 
 # ==================== Public Endpoints ====================
@@ -161,9 +161,16 @@ async def list_blacklist_entries(
     result = await db.execute(query)
     rows = result.all()
 
+    # Resolve tag names for the whole page at once instead of a query per entry
+    tag_name_map = await _get_tag_name_map(
+        db, {tid for blacklist, _ in rows for tid in (blacklist.tag_ids or [])}
+    )
+
     entries = []
     for blacklist, vn in rows:
-        tag_names = await _get_tag_names(db, blacklist.tag_ids)
+        tag_names = [
+            tag_name_map[tid] for tid in (blacklist.tag_ids or []) if tid in tag_name_map
+        ]
         entries.append(BlacklistEntryResponse(
             vnId=blacklist.vn_id,
             vnTitle=vn.title,
@@ -321,7 +321,8 @@ async def get_similar_characters(
     cache_key = f"char:similar:{normalized_id}:{limit}"
     cached = await cache.get(cache_key)
     if cached is not None:
-        return [schemas.SimilarCharacterResponse(**item) for item in cached]
+        # FastAPI validates the dicts against response_model anyway
+        return cached
 
     # Verify character exists and get its non-spoiler traits in one query
     target_traits_result = await db.execute(
@@ -3,7 +3,7 @@
 import logging
 
 from fastapi import APIRouter, Depends, Query, Response
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -34,7 +34,7 @@ class HigherLowerVN(BaseModel):
     year: int | None = None
     developer: str | None = None
     developer_original: str | None = None  # romanized form, for the title preference toggle
-    tags: list[str] = []
+    tags: list[str] = Field(default_factory=list)
 
 
 class HigherLowerPool(BaseModel):
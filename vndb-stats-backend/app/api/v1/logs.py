@@ -11,7 +11,7 @@ from urllib.parse import urlparse
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, field_validator
-from sqlalchemy import select, func, desc, delete, and_, or_
+from sqlalchemy import select, func, desc, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from slowapi import Limiter
@@ -21,6 +21,7 @@ from app.db.database import get_db, async_session
 from app.db.models import AppLog
 from app.config import get_settings
 from app.core.auth import require_admin
+from app.logging.cleanup import purge_old_logs
 
 router = APIRouter()
 settings = get_settings()
@@ -120,23 +121,30 @@ def _serialize_log(log: AppLog) -> AppLogResponse:
         url=log.url,
         stack_trace=log.stack_trace,
         occurrence_count=log.occurrence_count or 1,
-        error_hash=log.error_hash,
+        error_hash=log.error_hash.hex() if log.error_hash else None,
         correlation_id=log.correlation_id,
     )
 
 
-def compute_error_hash(message: str, url: str, component: Optional[str] = None) -> str:
-    """Compute hash for error deduplication."""
+# Variable parts stripped from error messages before hashing (compiled once;
+# normalization, not the digest itself, is the per-report cost here)
+_LINE_NUMBER_RE = re.compile(r'at line \d+')
+_HEX_ADDRESS_RE = re.compile(r'0x[0-9a-fA-F]+')
+_NUMBER_RE = re.compile(r'\d+')
+
+
+def compute_error_hash(message: str, url: str, component: Optional[str] = None) -> bytes:
+    """Compute hash for error deduplication (16 raw bytes, stored as bytea)."""
     # Normalize message - remove variable parts
-    normalized = re.sub(r'at line \d+', 'at line X', message)
-    normalized = re.sub(r'0x[0-9a-fA-F]+', '0xXXXX', normalized)
-    normalized = re.sub(r'\d+', 'N', normalized)  # Replace numbers
+    normalized = _LINE_NUMBER_RE.sub('at line X', message)
+    normalized = _HEX_ADDRESS_RE.sub('0xXXXX', normalized)
+    normalized = _NUMBER_RE.sub('N', normalized)  # Replace numbers
 
     # Use path only from URL
     url_path = urlparse(url).path if url else ''
 
     content = f"{normalized}|{url_path}|{component or ''}"
-    return hashlib.sha256(content.encode()).hexdigest()[:32]
+    return hashlib.sha256(content.encode()).digest()[:16]
 
 
 # Rate limiting storage (in-memory per worker). Stale buckets are evicted once the
@@ -296,14 +304,13 @@ async def stream_logs(
 async def submit_frontend_log(
     log: FrontendLogSubmission,
     request: Request,
-    db: AsyncSession = Depends(get_db),
 ):
     """
     Receive frontend error logs.
 
     Features:
     - Rate limiting by IP
-    - Error deduplication via hash
+    - Error deduplication via hash (applied when the queued batch is flushed)
     - Input validation
     """
     # Get client IP — prefer nginx-forwarded headers since request.client.host
@@ -323,27 +330,9 @@ async def submit_frontend_log(
             detail="Rate limit exceeded. Max 100 logs per minute."
         )
 
-    now = datetime.now(timezone.utc)
-
-    # Compute error hash for deduplication
-    error_hash = compute_error_hash(log.message, log.url, log.component)
-
-    # Check for existing log with same hash (within last hour)
-    one_hour_ago = now - timedelta(hours=1)
-    result = await db.execute(
-        select(AppLog)
-        .where(AppLog.error_hash == error_hash)
-        .where(AppLog.timestamp >= one_hour_ago)
-        .limit(1)
-    )
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        # Update occurrence count instead of creating new entry
-        existing.occurrence_count = (existing.occurrence_count or 1) + 1
-        existing.last_seen = now
-        await db.commit()
-        return {"status": "deduplicated", "id": existing.id, "occurrence_count": existing.occurrence_count}
+    handler = getattr(request.app.state, "db_log_handler", None)
+    if handler is None:
+        raise HTTPException(status_code=503, detail="Log ingestion unavailable")
 
     # Get correlation ID from header or body
     correlation_id = (
@@ -351,28 +340,23 @@ async def submit_frontend_log(
         or log.correlation_id
     )
 
-    # Create new log entry
-    log_entry = AppLog(
-        timestamp=now,
-        level=log.level.upper(),
-        source="frontend",
-        module=log.component,
-        message=log.message[:5000],  # Limit message length
-        url=log.url[:500] if log.url else None,
-        user_agent=log.user_agent[:500] if log.user_agent else None,
-        stack_trace=log.stack_trace[:10000] if log.stack_trace else None,
-        error_hash=error_hash,
-        occurrence_count=1,
-        first_seen=now,
-        last_seen=now,
-        extra_data=log.extra_data,
-        correlation_id=correlation_id,
-    )
-    db.add(log_entry)
-    await db.commit()
-    await db.refresh(log_entry)
-
-    return {"status": "created", "id": log_entry.id}
+    # Queue onto the batched DB log writer instead of a transaction per report.
+    # Deduplication by error_hash (within the last hour) happens at flush time.
+    handler.submit({
+        "timestamp": datetime.now(timezone.utc),
+        "level": log.level.upper(),
+        "source": "frontend",
+        "module": log.component,
+        "message": log.message[:5000],  # Limit message length
+        "url": log.url[:500] if log.url else None,
+        "user_agent": log.user_agent[:500] if log.user_agent else None,
+        "stack_trace": log.stack_trace[:10000] if log.stack_trace else None,
+        "error_hash": compute_error_hash(log.message, log.url, log.component),
+        "extra_data": log.extra_data,
+        "correlation_id": correlation_id,
+    })
+
+    return {"status": "queued"}
 
 
 @router.get("/stats", response_model=LogStatsResponse, dependencies=[Depends(require_admin)])
@@ -442,9 +426,11 @@ async def cleanup_old_logs(
     """Delete logs older than specified days."""
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-    result = await db.execute(
-        delete(AppLog).where(AppLog.timestamp < cutoff)
-    )
+    dropped, deleted_count = await purge_old_logs(db, cutoff)
     await db.commit()
 
-    return {"deleted_count": result.rowcount, "cutoff_date": cutoff.isoformat()}
+    return {
+        "deleted_count": deleted_count,
+        "dropped_partitions": dropped,
+        "cutoff_date": cutoff.isoformat(),
+    }
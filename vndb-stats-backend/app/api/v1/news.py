@@ -64,7 +64,7 @@ def _news_item_to_response(item: NewsItem) -> schemas.NewsItemResponse:
     )
 
 
-def _create_digest_item(source: str, date_key: str, items: list[NewsItem]) -> schemas.NewsListItem:
+def _create_digest_item(source: str, date_key: str, items: list[NewsItem]) -> schemas.NewsDigestItem:
     """Create a digest card from grouped news items."""
     # Sort items by published_at descending
     sorted_items = sorted(items, key=lambda x: x.published_at, reverse=True)
@@ -84,8 +84,7 @@ def _create_digest_item(source: str, date_key: str, items: list[NewsItem]) -> sc
     label = DIGEST_LABELS.get(source, source)
     title = f"{label} - {formatted_date}"
 
-    return schemas.NewsListItem(
-        type="digest",
+    return schemas.NewsDigestItem(
         id=f"digest-{source}-{date_key}",
         source=source,
         sourceLabel=label,
@@ -98,24 +97,6 @@ def _create_digest_item(source: str, date_key: str, items: list[NewsItem]) -> sc
     )
 
 
-def _news_item_to_list_item(item: NewsItem) -> schemas.NewsListItem:
-    """Convert a NewsItem to a NewsListItem for the unified response."""
-    return schemas.NewsListItem(
-        type="item",
-        id=item.id,
-        source=item.source,
-        sourceLabel=item.source_label or item.source,
-        title=item.title,
-        summary=item.summary,
-        url=item.url,
-        imageUrl=item.image_url,
-        imageIsNsfw=item.image_is_nsfw or False,
-        publishedAt=item.published_at,
-        tags=item.tags,
-        extraData=item.extra_data,
-    )
-
-
 def _parse_date(date_str: str) -> datetime:
     """Parse YYYY-MM-DD string to date, raise HTTPException on invalid."""
     try:
@@ -205,7 +186,7 @@ async def list_news(
             items = result.scalars().all()
 
         return schemas.NewsListResponse(
-            items=[_news_item_to_list_item(item) for item in items],
+            items=[_news_item_to_response(item) for item in items],
             total=total,
             page=page,
             pages=math.ceil(total / limit) if total > 0 else 0,
@@ -241,7 +222,7 @@ async def list_news(
         items = result.scalars().all()
 
         return schemas.NewsListResponse(
-            items=[_news_item_to_list_item(item) for item in items],
+            items=[_news_item_to_response(item) for item in items],
             total=total,
             page=page,
             pages=math.ceil(total / limit) if total > 0 else 0,
@@ -262,17 +243,17 @@ async def list_news(
 
     # Group digest sources by date, keep others as individual items
     digest_groups: dict[str, dict[str, list[NewsItem]]] = defaultdict(lambda: defaultdict(list))
-    individual_items: list[schemas.NewsListItem] = []
+    individual_items: list[schemas.NewsItemResponse] = []
 
     for item in all_items:
         if item.source in DIGEST_SOURCES:
             date_key = item.published_at.strftime("%Y-%m-%d")
             digest_groups[item.source][date_key].append(item)
         else:
-            individual_items.append(_news_item_to_list_item(item))
+            individual_items.append(_news_item_to_response(item))
 
     # Create digest cards from groups
-    digest_items: list[schemas.NewsListItem] = []
+    digest_items: list[schemas.NewsDigestItem] = []
     for source_name, date_groups in digest_groups.items():
         for date_key, items_in_date in date_groups.items():
             digest_items.append(_create_digest_item(source_name, date_key, items_in_date))
@@ -419,20 +400,7 @@ async def get_digest(
         )
 
     # Reuse existing helper for consistent digest creation
-    digest = _create_digest_item(source, date_str, items)
-
-    return schemas.NewsDigestItem(
-        type="digest",
-        id=digest.id,
-        source=digest.source,
-        sourceLabel=digest.sourceLabel,
-        title=digest.title,
-        date=digest.date,
-        count=digest.count,
-        items=digest.items,
-        publishedAt=digest.publishedAt,
-        previewImages=digest.previewImages,
-    )
+    return _create_digest_item(source, date_str, items)
 
 
 @router.get("/{item_id}", response_model=schemas.NewsItemResponse)
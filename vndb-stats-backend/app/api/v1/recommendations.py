@@ -46,6 +46,7 @@ from app.db import schemas
 from app.db.models import UserRecommendationCache, VisualNovel
 from app.db.query_utils import not_in_ids
 from app.core.auth import is_admin_request
+from app.core.responses import model_response
 from app.services.recommendation_service import RecommendationService
 from app.services.user_service import UserService
 from app.services.hybrid_recommender import HybridRecommender, RecommendationResult
@@ -182,14 +183,14 @@ async def get_recommendations(
             parts.append(f"{dropped_count} dropped")
         exclusion_message = f"Excluding {total_excluded} novel(s) including {' and '.join(parts)}"
 
-    return schemas.RecommendationsResponse(
+    return model_response(schemas.RecommendationsResponse(
         method=method.value,
         recommendations=recommendations,
         excluded_count=total_excluded,
         dropped_count=dropped_count,
         blacklisted_count=blacklisted_count,
         total_excluded_message=exclusion_message,
-    )
+    ))
 
 
 @router.get("/{vndb_uid}/similar/{vn_id}", response_model=schemas.SimilarVNsResponse, include_in_schema=False)
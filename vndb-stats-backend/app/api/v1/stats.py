@@ -284,8 +284,10 @@ async def get_tag_vns_by_category(
         numeric_tag_id, category_type, category_value, limit, offset
     )
 
+    # Pass the row dicts through: pydantic-core validates the whole list in one
+    # call instead of a Python-level VNSummary(**vn) per item
     return schemas.VNListByCategoryResponse(
-        vns=[schemas.VNSummary(**vn) for vn in vns],
+        vns=vns,
         total=total,
         limit=limit,
         offset=offset,
@@ -352,19 +354,7 @@ async def get_tag_vns_with_tags(
             vn_count=tag.vn_count or 0,
             aliases=tag.aliases.split(",") if tag.aliases and isinstance(tag.aliases, str) else None,
         ),
-        vns=[schemas.VNWithTags(
-            id=vn["id"],
-            title=vn["title"],
-            title_jp=vn["title_jp"],
-            title_romaji=vn["title_romaji"],
-            image_url=vn["image_url"],
-            image_sexual=vn["image_sexual"],
-            released=vn["released"],
-            rating=vn["rating"],
-            votecount=vn["votecount"],
-            olang=vn["olang"],
-            tags=[schemas.VNTagInfo(**t) for t in vn["tags"]],
-        ) for vn in vns],
+        vns=vns,
         total=total,
         page=page,
         pages=pages,
@@ -739,19 +729,7 @@ async def get_trait_vns_with_tags(
     )
 
     return schemas.TraitVNsWithTagsResponse(
-        vns=[schemas.VNWithTags(
-            id=vn["id"],
-            title=vn["title"],
-            title_jp=vn["title_jp"],
-            title_romaji=vn["title_romaji"],
-            image_url=vn["image_url"],
-            image_sexual=vn["image_sexual"],
-            released=vn["released"],
-            rating=vn["rating"],
-            votecount=vn["votecount"],
-            olang=vn["olang"],
-            tags=[schemas.VNTagInfo(**t) for t in vn["tags"]],
-        ) for vn in vns],
+        vns=vns,
         total=total,
         page=page,
         pages=pages,
@@ -806,7 +784,7 @@ async def get_trait_vns_by_category(
     )
 
     return schemas.VNListByCategoryResponse(
-        vns=[schemas.VNSummary(**vn) for vn in vns],
+        vns=vns,
         total=total,
         limit=limit,
         offset=offset,
@@ -1250,7 +1228,7 @@ async def get_producer_vns_with_tags(
 
     vns, total, pages = result
     return schemas.ProducerVNsWithTagsResponse(
-        vns=[schemas.VNWithTags(**vn) for vn in vns],
+        vns=vns,
         total=total,
         page=page,
         pages=pages,
@@ -1445,7 +1423,7 @@ async def get_staff_vns_with_tags(
 
     vns, total, pages = result
     return schemas.StaffVNsWithTagsResponse(
-        vns=[schemas.VNWithTags(**vn) for vn in vns],
+        vns=vns,
         total=total,
         page=page,
         pages=pages,
@@ -1607,7 +1585,7 @@ async def get_seiyuu_vns_with_tags(
 
     vns, total, pages = result
     return schemas.SeiyuuVNsWithTagsResponse(
-        vns=[schemas.VNWithTags(**vn) for vn in vns],
+        vns=vns,
         total=total,
         page=page,
         pages=pages,
@@ -9,6 +9,7 @@ from slowapi.util import get_remote_address
 
 from app.db.database import get_db
 from app.db import schemas
+from app.core.responses import model_response
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -60,7 +61,6 @@ async def get_user_profile(
 @router.get("/{vndb_uid}/list", response_model=schemas.UserVNListResponse)
 async def get_user_vn_list(
     vndb_uid: str,
-    response: Response,
     db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     limit: int = Query(50, ge=1, le=2000, description="Items per page"),
@@ -75,9 +75,6 @@ async def get_user_vn_list(
 
     Data comes from local database (VNDB dumps).
     """
-    # Set cache headers - user-specific data
-    response.headers["Cache-Control"] = "private, max-age=300"  # 5 minutes
-
     user_service = UserService(db)
 
     # Check if user exists in our database
@@ -88,13 +85,16 @@ async def get_user_vn_list(
             detail=f"User {vndb_uid} not found in database. The user may not have a public list or hasn't been imported yet."
         )
 
-    return await user_service.get_user_vn_list_with_metadata(
+    vn_list = await user_service.get_user_vn_list_with_metadata(
         vndb_uid,
         page=page,
         limit=limit,
         label_filter=label,
         sort=sort
     )
+    # Up to 2000 items per page, so encode once instead of FastAPI re-validating.
+    # Cache headers - user-specific data, 5 minutes
+    return model_response(vn_list, headers={"Cache-Control": "private, max-age=300"})
 
 
 @router.post("/{vndb_uid}/refresh", include_in_schema=False)
@@ -5,7 +5,7 @@ import logging
 import re
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, delete, case, and_, or_, text
 from sqlalchemy.dialects.postgresql import insert
@@ -20,6 +20,7 @@ from app.services.extlinks_service import build_extlink_url, build_wikidata_link
 from app.core.vndb_client import get_vndb_client
 from app.core.auth import require_admin
 from app.core.cache import get_cache
+from app.core.responses import model_response
 from app.core.search_utils import relevance_rank
 
 logger = logging.getLogger(__name__)
@@ -193,7 +194,6 @@ async def search_vns(
     # Performance options
     skip_count: bool = Query(default=False, description="Skip total count query (faster for autocomplete dropdowns)"),
 
-    response: Response = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -227,9 +227,10 @@ async def search_vns(
         cached = await cache.get(cache_key)
         if cached:
             cached["query_time"] = round(time.time() - start_time, 3)
-            if response is not None:
-                response.headers["Cache-Control"] = "public, max-age=30, stale-while-revalidate=300"
-            return schemas.VNSearchResponse(**cached)
+            return model_response(
+                schemas.VNSearchResponse(**cached),
+                headers={"Cache-Control": "public, max-age=30, stale-while-revalidate=300"},
+            )
 
     # Only select the columns needed for VNSummary response
     _browse_columns = [
@@ -248,8 +249,9 @@ async def search_vns(
     # Expression indexes exist for these patterns (migration 032) - expressions must match exactly.
     if q:
         eq = _escape_like(q)
-        # Aliases expression matching the index: array_to_string(COALESCE(aliases, '{}'), ' ')
-        _aliases_expr = func.array_to_string(func.coalesce(VisualNovel.aliases, text("'{}'::text[]")), ' ')
+        # Aliases expression matching the index (migration 049): vn_aliases_text(aliases),
+        # an IMMUTABLE wrapper around array_to_string(COALESCE(aliases, '{}'), ' ')
+        _aliases_expr = func.vn_aliases_text(VisualNovel.aliases)
         # Direct substring match (uses GIN trigram indexes)
         search_filter = or_(
             VisualNovel.title.ilike(f"%{eq}%"),
@@ -266,7 +268,7 @@ async def search_vns(
             # These expressions match the index definitions in migration 032:
             #   lower(regexp_replace(title, '[^a-zA-Z0-9]', '', 'g'))
             #   lower(regexp_replace(COALESCE(title_romaji, ''), '[^a-zA-Z0-9]', '', 'g'))
-            #   lower(regexp_replace(array_to_string(COALESCE(aliases, '{}'), ' '), '[^a-zA-Z0-9]', '', 'g'))
+            #   lower(regexp_replace(vn_aliases_text(aliases), '[^a-zA-Z0-9]', '', 'g'))  (migration 049)
             _norm_title = func.lower(func.regexp_replace(VisualNovel.title, '[^a-zA-Z0-9]', '', 'g'))
             _norm_romaji = func.lower(func.regexp_replace(func.coalesce(VisualNovel.title_romaji, ''), '[^a-zA-Z0-9]', '', 'g'))
             _norm_aliases = func.lower(func.regexp_replace(_aliases_expr, '[^a-zA-Z0-9]', '', 'g'))
@@ -985,7 +987,8 @@ async def search_vns(
 
     search_response = schemas.VNSearchResponse(
         results=[
-            schemas.VNSummary(
+            # Up to `limit` rows of driver-typed columns: nothing to coerce
+            schemas.VNSummary.model_construct(
                 id=vn.id,
                 title=vn.title,
                 title_jp=vn.title_jp,
@@ -1014,10 +1017,11 @@ async def search_vns(
 
     # HTTP cache headers for browser caching (production uses fetch cache: 'default').
     # 30s hard cache + 5min stale-while-revalidate = revisiting same filters is instant.
-    if sort != "random" and response is not None:
-        response.headers["Cache-Control"] = "public, max-age=30, stale-while-revalidate=300"
+    headers = None
+    if sort != "random":
+        headers = {"Cache-Control": "public, max-age=30, stale-while-revalidate=300"}
 
-    return search_response
+    return model_response(search_response, headers=headers)
 
 
 @router.get("/traits/counts")
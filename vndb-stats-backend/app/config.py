@@ -61,6 +61,7 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = "redis://localhost:6379"
+    redis_pool_size: int = 50  # Max pooled connections shared by concurrent requests
     cache_ttl_seconds: int = 600  # 10 minutes default cache (increased from 5 min)
 
     # VNDB API
@@ -132,6 +133,7 @@ class Settings(BaseSettings):
     user_stats_timeout: int = 60  # Timeout for user stats calculation (seconds)
     max_user_vns: int = 2000  # Maximum VNs to process per user (prevents extreme cases)
     vndb_parallel_pages: int = 5  # Number of pages to fetch in parallel from VNDB
+    vndb_bulkhead_cap: int = 20  # Max in-flight VNDB API requests per process, across all users
 
     # Retry settings
     max_retry_attempts: int = 3  # Default retry attempts for network operations
@@ -1,45 +1,177 @@
 """Redis caching layer."""
 
-import json
+import asyncio
+import functools
 import logging
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
+import zstandard as zstd
 
 from app.config import get_settings
+from app.core.tasks import TaskManager
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Non-str dict keys (e.g. {2019: 12}) are stringified, matching json.dumps
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Values at least this large (user lists, stats, recommendations) are stored
+# zstd-compressed. Level 1 is cheap on CPU and still shrinks JSON several-fold.
+COMPRESS_MIN_BYTES = 1024
+# Every zstd frame starts with this magic number, which JSON text can never
+# start with, so compressed and plain (including pre-existing) values need no
+# extra header byte to tell apart.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_compressor = zstd.ZstdCompressor(level=1)
+_decompressor = zstd.ZstdDecompressor()
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache value to JSON bytes, compressing large payloads."""
+    raw = orjson.dumps(value, option=_ORJSON_OPTIONS)
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        return _compressor.compress(raw)
+    return raw
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize a cached value.
+
+    orjson parses the raw bytes from the socket directly, without first
+    decoding them into an intermediate str like json.loads does.
+    """
+    if raw[:4] == _ZSTD_MAGIC:
+        raw = _decompressor.decompress(raw)
+    return orjson.loads(raw)
+
+
+class CacheWriteBatcher:
+    """
+    Write-behind buffer that coalesces background cache writes.
+
+    Writes queued within FLUSH_DELAY of each other are sent in a single
+    non-transactional pipeline, so a burst of N writes costs one Redis
+    round-trip instead of N. Values become visible up to FLUSH_DELAY later.
+    """
+
+    FLUSH_DELAY = 0.005  # Seconds to collect writes before flushing
+
+    def __init__(self, cache: "CacheService"):
+        self._cache = cache
+        self._pending: list[tuple[str, bytes, int | None]] = []
+        self._lock = asyncio.Lock()
+        # Pending flush timer and the loop it was scheduled on
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_loop: asyncio.AbstractEventLoop | None = None
+
+    def add(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Queue a write and make sure a flush is scheduled.
+
+        Returns False (like CacheService.set()) if the value can't be serialized.
+        """
+        # Serialize now so later mutation of `value` by the caller can't leak in
+        try:
+            serialized = _dumps(value)
+        except Exception as e:
+            logger.warning(f"Cache set error for {key}: {e}")
+            return False
+        self._pending.append((key, serialized, ttl))
+        loop = asyncio.get_running_loop()
+        if self._timer is not None and self._timer_loop is loop:
+            return True
+        if self._timer_loop is not loop:
+            # The cache is a process-wide singleton; scripts may call
+            # asyncio.run() more than once. A timer left on a previous (maybe
+            # closed) loop would never fire, and the lock is bound to it too.
+            self.cancel_timer()
+            self._lock = asyncio.Lock()
+        self._timer = loop.call_later(self.FLUSH_DELAY, self._start_flush)
+        self._timer_loop = loop
+        return True
+
+    def cancel_timer(self) -> None:
+        """Cancel the pending flush timer, if any (queued writes stay queued)."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+
+    def _start_flush(self) -> None:
+        TaskManager.get_instance().create_task(self.flush(), name="cache_write_flush")
+
+    async def flush(self) -> int:
+        """Send all queued writes in one pipeline. Returns the number written."""
+        async with self._lock:
+            self.cancel_timer()
+            pending, self._pending = self._pending, []
+            if not pending:
+                return 0
+            try:
+                client = self._cache._redis or await self._cache._get_redis()
+                async with client.pipeline(transaction=False) as pipe:
+                    for key, serialized, ttl in pending:
+                        if ttl:
+                            pipe.setex(key, ttl, serialized)
+                        else:
+                            pipe.set(key, serialized)
+                    await pipe.execute()
+                return len(pending)
+            except Exception as e:
+                logger.warning(f"Cache batched write error for {len(pending)} keys: {e}")
+                return 0
+
 
 class CacheService:
     """Async Redis cache service."""
 
     def __init__(self):
+        self._pool: redis.ConnectionPool | None = None
         self._redis: redis.Redis | None = None
+        self._batcher = CacheWriteBatcher(self)
+
+    async def init(self) -> None:
+        """Create the pooled Redis client eagerly.
+
+        Called from the API lifespan so request-path methods can use
+        ``self._redis`` directly. Concurrent coroutines each check out their
+        own connection from the pool instead of queueing behind a single one.
+        """
+        if self._redis is not None:
+            return
+        self._pool = redis.ConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_pool_size,
+            decode_responses=False,
+        )
+        self._redis = redis.Redis(connection_pool=self._pool)
 
     async def _get_redis(self) -> redis.Redis:
-        """Get or create Redis connection."""
+        """Lazily initialize the client (worker, bot and scripts skip init())."""
         if self._redis is None:
-            self._redis = redis.from_url(
-                settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
+            await self.init()
         return self._redis
 
     async def close(self):
-        """Close Redis connection."""
+        """Close Redis client and disconnect all pooled connections."""
+        # A timer firing after close would recreate the pool via _get_redis()
+        self._batcher.cancel_timer()
+        await self._batcher.flush()
         if self._redis:
-            await self._redis.close()
+            await self._redis.aclose()
+            self._redis = None
+        if self._pool:
+            await self._pool.disconnect()
+            self._pool = None
 
     async def get(self, key: str) -> Any | None:
         """Get value from cache."""
         try:
-            client = await self._get_redis()
+            client = self._redis or await self._get_redis()
             value = await client.get(key)
             if value:
-                return json.loads(value)
+                return _loads(value)
             return None
         except Exception as e:
             logger.warning(f"Cache get error for {key}: {e}")
@@ -53,8 +185,8 @@ class CacheService:
     ) -> bool:
         """Set value in cache with optional TTL."""
         try:
-            client = await self._get_redis()
-            serialized = json.dumps(value)
+            client = self._redis or await self._get_redis()
+            serialized = _dumps(value)
             if ttl:
                 await client.setex(key, ttl, serialized)
             else:
@@ -64,10 +196,33 @@ class CacheService:
             logger.warning(f"Cache set error for {key}: {e}")
             return False
 
+    def set_async(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+    ) -> bool:
+        """Schedule a cache write in the background without awaiting it.
+
+        For cache population that isn't correctness-critical: the caller
+        returns without waiting on the Redis round-trip. Use set() when the
+        write must be confirmed before continuing.
+        """
+        return self.set_batched(key, value, ttl)
+
+    def set_batched(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+    ) -> bool:
+        """Queue a write on the shared write-behind batcher (see CacheWriteBatcher)."""
+        return self._batcher.add(key, value, ttl)
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         try:
-            client = await self._get_redis()
+            client = self._redis or await self._get_redis()
             await client.delete(key)
             return True
         except Exception as e:
@@ -77,7 +232,7 @@ class CacheService:
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         try:
-            client = await self._get_redis()
+            client = self._redis or await self._get_redis()
             return await client.exists(key) > 0
         except Exception as e:
             logger.warning(f"Cache exists error for {key}: {e}")
@@ -86,7 +241,7 @@ class CacheService:
     async def flush_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern. Returns count of deleted keys."""
         try:
-            client = await self._get_redis()
+            client = self._redis or await self._get_redis()
             deleted = 0
             async for key in client.scan_iter(match=pattern, count=500):
                 await client.delete(key)
@@ -115,13 +270,7 @@ class CacheService:
         return f"recs:{method}:{uid}"
 
 
-# Singleton cache instance
-_cache: CacheService | None = None
-
-
+@functools.cache
 def get_cache() -> CacheService:
-    """Get the singleton cache service."""
-    global _cache
-    if _cache is None:
-        _cache = CacheService()
-    return _cache
+    """Get the singleton cache service (reset with get_cache.cache_clear())."""
+    return CacheService()
@@ -0,0 +1,23 @@
+"""Response helpers for routes returning large pydantic envelopes."""
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_response(model: BaseModel, headers: dict[str, str] | None = None) -> Response:
+    """Serialize an already-built response model straight to JSON.
+
+    Returning a plain model makes FastAPI dump it to a dict, validate that
+    against response_model again and only then encode it, which for list
+    envelopes (search results, user lists, recommendations) is most of the
+    request's CPU time. This encodes once in pydantic-core instead. Routes
+    keep their response_model for the OpenAPI schema.
+
+    Headers set on an injected Response are not copied onto a returned
+    Response, so pass them here.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
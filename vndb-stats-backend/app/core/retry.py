@@ -8,6 +8,7 @@ import asyncio
 import functools
 import logging
 import random
+import time
 from dataclasses import dataclass, field
 from typing import Callable, TypeVar, Any
 
@@ -26,7 +27,7 @@ class RetryConfig:
     base_delay: float = 1.0  # Initial delay in seconds
     max_delay: float = 60.0  # Maximum delay between retries
     exponential_base: float = 2.0  # Multiplier for exponential backoff
-    jitter: float = 0.1  # Random jitter factor (0.1 = +/- 10%)
+    jitter: float = 0.1  # Unused: delays use full jitter. Kept for callers that still pass it
     retryable_exceptions: tuple = field(
         default_factory=lambda: (
             httpx.TimeoutException,
@@ -39,32 +40,119 @@ class RetryConfig:
     retryable_status_codes: tuple = field(
         default_factory=lambda: (500, 502, 503, 504, 520, 521, 522, 523, 524)
     )
+    # Retry budget shared by every call with the same scope (defaults to the
+    # decorated function's qualified name; required for RetryContext)
+    budget_scope: str | None = None
 
 
-def calculate_delay(attempt: int, config: RetryConfig) -> float:
-    """Calculate delay with exponential backoff and jitter."""
-    # Exponential backoff: base_delay * (exponential_base ^ attempt)
-    delay = config.base_delay * (config.exponential_base ** attempt)
+class RetryBudget:
+    """
+    Token bucket that caps how many retries a scope may issue.
+
+    Every retry spends ``retry_cost`` tokens; successful calls earn tokens back
+    and the bucket also refills slowly over time. While an upstream is down,
+    first attempts keep failing, the bucket drains and further retries are
+    refused, so callers fail fast instead of multiplying load on it.
+    """
+
+    def __init__(
+        self,
+        capacity: float = 50.0,
+        retry_cost: float = 5.0,
+        success_refund: float = 1.0,
+        refill_rate: float = 0.5,  # Tokens per second
+    ):
+        self.capacity = capacity
+        self.retry_cost = retry_cost
+        self.success_refund = success_refund
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate
+        )
+        self.last_refill = now
+
+    def acquire(self) -> bool:
+        """Spend tokens for one retry. Returns False if the budget is exhausted."""
+        self._refill()
+        if self.tokens < self.retry_cost:
+            return False
+        self.tokens -= self.retry_cost
+        return True
+
+    def release(self, retries: int = 1) -> None:
+        """Refund the tokens spent on ``retries`` retries once the call succeeded."""
+        self.tokens = min(self.capacity, self.tokens + retries * self.retry_cost)
+
+    def on_success(self) -> None:
+        """Earn a small refund for a call that succeeded on its first attempt."""
+        self.tokens = min(self.capacity, self.tokens + self.success_refund)
 
-    # Cap at max_delay
-    delay = min(delay, config.max_delay)
 
-    # Add jitter to prevent thundering herd
-    jitter_range = delay * config.jitter
-    delay = delay + random.uniform(-jitter_range, jitter_range)
+_budgets: dict[str, RetryBudget] = {}
 
-    return max(0, delay)  # Ensure non-negative
+
+def get_retry_budget(scope: str) -> RetryBudget:
+    """Get (or create) the shared retry budget for a scope."""
+    budget = _budgets.get(scope)
+    if budget is None:
+        budget = _budgets[scope] = RetryBudget()
+    return budget
+
+
+def backoff_caps(config: RetryConfig) -> tuple[float, ...]:
+    """Un-jittered exponential delays for each retry, capped at max_delay.
+
+    Computed once per decorated function / retry loop so the retry path only
+    has to apply full jitter before sleeping.
+    """
+    return tuple(
+        min(config.base_delay * (config.exponential_base ** attempt), config.max_delay)
+        for attempt in range(max(config.max_attempts - 1, 0))
+    )
+
+
+def full_jitter(cap: float) -> float:
+    """Pick a delay uniformly from [0, cap) ("full jitter").
+
+    Spreading retries over the whole window instead of +/- a few percent keeps
+    many clients failing at once from retrying in lockstep against an upstream
+    that is already struggling.
+    """
+    return random.random() * cap
+
+
+def calculate_delay(attempt: int, config: RetryConfig) -> float:
+    """Calculate delay with exponential backoff and full jitter."""
+    # Exponential backoff: base_delay * (exponential_base ^ attempt), capped at max_delay
+    cap = min(config.base_delay * (config.exponential_base ** attempt), config.max_delay)
+    return full_jitter(cap)
 
 
 def is_retryable_exception(exc: Exception, config: RetryConfig) -> bool:
     """Check if an exception should trigger a retry."""
+    return _is_retryable(
+        exc, config.retryable_exceptions, frozenset(config.retryable_status_codes)
+    )
+
+
+def _is_retryable(
+    exc: Exception,
+    retryable_exceptions: tuple,
+    status_codes: frozenset[int],
+) -> bool:
+    """is_retryable_exception() with the config fields already unpacked."""
     # Check if it's a directly retryable exception type
-    if isinstance(exc, config.retryable_exceptions):
+    if isinstance(exc, retryable_exceptions):
         return True
 
     # Special handling for HTTP status errors
     if isinstance(exc, httpx.HTTPStatusError):
-        return exc.response.status_code in config.retryable_status_codes
+        return exc.response.status_code in status_codes
 
     return False
 
@@ -86,31 +174,50 @@ def async_retry(config: RetryConfig | None = None):
     if config is None:
         config = RetryConfig()
 
+    # Resolve everything the retry path needs once, at decoration time
+    max_attempts = config.max_attempts
+    retryable_exceptions = config.retryable_exceptions
+    status_codes = frozenset(config.retryable_status_codes)
+    caps = backoff_caps(config)
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        budget = get_retry_budget(config.budget_scope or func.__qualname__)
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> T:
             last_exception: Exception | None = None
 
-            for attempt in range(config.max_attempts):
+            for attempt in range(max_attempts):
                 try:
-                    return await func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
+                    if attempt:
+                        budget.release(attempt)
+                    else:
+                        budget.on_success()
+                    return result
                 except Exception as e:
                     last_exception = e
 
-                    if not is_retryable_exception(e, config):
+                    if not _is_retryable(e, retryable_exceptions, status_codes):
                         # Non-retryable exception, raise immediately
                         raise
 
-                    if attempt < config.max_attempts - 1:
-                        delay = calculate_delay(attempt, config)
+                    if attempt < max_attempts - 1:
+                        if not budget.acquire():
+                            logger.warning(
+                                f"Retry budget exhausted for {func.__name__}, not retrying "
+                                f"after {type(e).__name__}: {e}"
+                            )
+                            raise
+                        delay = full_jitter(caps[attempt])
                         logger.warning(
-                            f"Retry {attempt + 1}/{config.max_attempts} for {func.__name__} "
+                            f"Retry {attempt + 1}/{max_attempts} for {func.__name__} "
                             f"after {type(e).__name__}: {e}. Waiting {delay:.2f}s"
                         )
                         await asyncio.sleep(delay)
                     else:
                         logger.error(
-                            f"All {config.max_attempts} attempts failed for {func.__name__}: {e}"
+                            f"All {max_attempts} attempts failed for {func.__name__}: {e}"
                         )
 
             # All retries exhausted
@@ -139,19 +246,33 @@ async def retry_async(
     if config is None:
         config = RetryConfig()
 
+    status_codes = frozenset(config.retryable_status_codes)
+    caps = backoff_caps(config)
+    budget = get_retry_budget(config.budget_scope or func.__qualname__)
     last_exception: Exception | None = None
 
     for attempt in range(config.max_attempts):
         try:
-            return await func(*args, **kwargs)
+            result = await func(*args, **kwargs)
+            if attempt:
+                budget.release(attempt)
+            else:
+                budget.on_success()
+            return result
         except Exception as e:
             last_exception = e
 
-            if not is_retryable_exception(e, config):
+            if not _is_retryable(e, config.retryable_exceptions, status_codes):
                 raise
 
             if attempt < config.max_attempts - 1:
-                delay = calculate_delay(attempt, config)
+                if not budget.acquire():
+                    logger.warning(
+                        f"Retry budget exhausted for {func.__name__}, not retrying "
+                        f"after {type(e).__name__}: {e}"
+                    )
+                    raise
+                delay = full_jitter(caps[attempt])
                 logger.warning(
                     f"Retry {attempt + 1}/{config.max_attempts} for {func.__name__} "
                     f"after {type(e).__name__}: {e}. Waiting {delay:.2f}s"
@@ -169,8 +290,11 @@ class RetryContext:
     """
     Context manager for retry logic in more complex scenarios.
 
+    Unlike the decorator there is no function name to scope the retry budget
+    by, so the config must set ``budget_scope``.
+
     Usage:
-        async with RetryContext(config) as ctx:
+        async with RetryContext(RetryConfig(budget_scope="vndb_dumps")) as ctx:
             while ctx.should_retry():
                 try:
                     result = await some_operation()
@@ -183,12 +307,23 @@ class RetryContext:
         self.config = config or RetryConfig()
         self.attempt = 0
         self.last_exception: Exception | None = None
+        self._status_codes = frozenset(self.config.retryable_status_codes)
+        self._caps = backoff_caps(self.config)
+        if not self.config.budget_scope:
+            raise ValueError("RetryContext requires RetryConfig.budget_scope")
+        self._budget = get_retry_budget(self.config.budget_scope)
+        # Retries this context actually took tokens for
+        self._retries_spent = 0
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        pass
+        if exc_type is None:
+            if self._retries_spent:
+                self._budget.release(self._retries_spent)
+            else:
+                self._budget.on_success()
 
     def should_retry(self) -> bool:
         """Check if another retry attempt should be made."""
@@ -199,14 +334,21 @@ class RetryContext:
         self.last_exception = exc
         self.attempt += 1
 
-        if not is_retryable_exception(exc, self.config):
+        if not _is_retryable(exc, self.config.retryable_exceptions, self._status_codes):
             raise exc
 
         if self.attempt >= self.config.max_attempts:
             logger.error(f"All {self.config.max_attempts} attempts exhausted: {exc}")
             raise exc
 
-        delay = calculate_delay(self.attempt - 1, self.config)
+        if not self._budget.acquire():
+            logger.warning(
+                f"Retry budget exhausted, not retrying after {type(exc).__name__}: {exc}"
+            )
+            raise exc
+        self._retries_spent += 1
+
+        delay = full_jitter(self._caps[self.attempt - 1])
         logger.warning(
             f"Retry {self.attempt}/{self.config.max_attempts} "
             f"after {type(exc).__name__}: {exc}. Waiting {delay:.2f}s"
@@ -5,13 +5,56 @@ background asyncio tasks with proper error handling, logging, and cleanup.
 """
 
 import asyncio
+import functools
 import logging
 from typing import Callable, Awaitable, Any
-from weakref import WeakSet
 
 logger = logging.getLogger(__name__)
 
 
+async def _run_tracked(
+    coro: Awaitable[Any],
+    task_name: str,
+    on_error: Callable[[Exception], Awaitable[None]] | None,
+    error_handlers: list[Callable[[str, Exception], Awaitable[None]]],
+) -> Any:
+    """Run a background coroutine, logging and dispatching any failure.
+
+    A module-level runner instead of a per-task closure: TaskManager passes its
+    global handler list by reference, so handlers added later still apply.
+    """
+    try:
+        # Lazy %-formatting: at INFO+ these are dropped without building a string
+        logger.debug("Starting background task: %s", task_name)
+        result = await coro
+        logger.debug("Background task completed: %s", task_name)
+        return result
+    except asyncio.CancelledError:
+        logger.info(f"Background task cancelled: {task_name}")
+        raise
+    except Exception as e:
+        logger.error(f"Background task failed: {task_name} - {type(e).__name__}: {e}")
+
+        # Call task-specific error handler
+        if on_error:
+            try:
+                await on_error(e)
+            except Exception as handler_error:
+                logger.error(
+                    f"Error handler failed for {task_name}: {handler_error}"
+                )
+
+        # Call global error handlers
+        for handler in error_handlers:
+            try:
+                await handler(task_name, e)
+            except Exception as handler_error:
+                logger.error(f"Global error handler failed: {handler_error}")
+
+        # Re-raise to mark task as failed
+        raise
+
+
 class TaskManager:
     """
     Manage background tasks with error handling and tracking.
@@ -33,24 +76,26 @@ class TaskManager:
         await task_manager.cancel_all()
     """
 
-    _instance: "TaskManager | None" = None
+    _instance: "TaskManager"  # Created once at module import, see bottom of file
 
     def __init__(self):
-        self._tasks: WeakSet[asyncio.Task] = WeakSet()
+        # Strong refs to unfinished tasks; each removes itself when done
+        self._running_set: set[asyncio.Task] = set()
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
         self._named_tasks: dict[str, asyncio.Task] = {}
         self._error_handlers: list[Callable[[str, Exception], Awaitable[None]]] = []
 
     @classmethod
     def get_instance(cls) -> "TaskManager":
         """Get the singleton TaskManager instance."""
-        if cls._instance is None:
-            cls._instance = cls()
         return cls._instance
 
     @classmethod
     def reset_instance(cls) -> None:
-        """Reset the singleton instance (for testing)."""
-        cls._instance = None
+        """Replace the singleton with a fresh instance (for testing)."""
+        cls._instance = cls()
 
     def create_task(
         self,
@@ -69,58 +114,40 @@ class TaskManager:
         Returns:
             The created asyncio.Task
         """
-
-        async def wrapped_coro():
-            task_name = name or "unnamed"
-            try:
-                logger.debug(f"Starting background task: {task_name}")
-                result = await coro
-                logger.debug(f"Background task completed: {task_name}")
-                return result
-            except asyncio.CancelledError:
-                logger.info(f"Background task cancelled: {task_name}")
-                raise
-            except Exception as e:
-                logger.error(f"Background task failed: {task_name} - {type(e).__name__}: {e}")
-
-                # Call task-specific error handler
-                if on_error:
-                    try:
-                        await on_error(e)
-                    except Exception as handler_error:
-                        logger.error(
-                            f"Error handler failed for {task_name}: {handler_error}"
-                        )
-
-                # Call global error handlers
-                for handler in self._error_handlers:
-                    try:
-                        await handler(task_name, e)
-                    except Exception as handler_error:
-                        logger.error(f"Global error handler failed: {handler_error}")
-
-                # Re-raise to mark task as failed
-                raise
-
-        task = asyncio.create_task(wrapped_coro(), name=name)
-        self._tasks.add(task)
+        task = asyncio.create_task(
+            _run_tracked(coro, name or "unnamed", on_error, self._error_handlers),
+            name=name,
+        )
+        self._running_set.add(task)
+        task.add_done_callback(self._on_task_done)
 
         if name:
-            # If a task with this name exists and is done, replace it
-            existing = self._named_tasks.get(name)
-            if existing and existing.done():
-                del self._named_tasks[name]
+            # Unlinked as soon as it finishes, so finished tasks (and their
+            # results/exceptions) aren't held until someone polls get_task()
             self._named_tasks[name] = task
+            task.add_done_callback(functools.partial(self._forget_named, name))
 
         return task
 
-    def get_task(self, name: str) -> asyncio.Task | None:
-        """Get a named task by name."""
-        task = self._named_tasks.get(name)
-        if task and task.done():
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """Done-callback: move a task from running to its final-state counter."""
+        self._running_set.discard(task)
+        if task.cancelled():
+            self._cancelled += 1
+        elif task.exception() is not None:
+            self._failed += 1
+        else:
+            self._completed += 1
+
+    def _forget_named(self, name: str, task: asyncio.Task) -> None:
+        """Done-callback: drop a finished task from the name index."""
+        # A newer task may have taken over the name; only remove our own entry
+        if self._named_tasks.get(name) is task:
             del self._named_tasks[name]
-            return None
-        return task
+
+    def get_task(self, name: str) -> asyncio.Task | None:
+        """Get a running named task by name."""
+        return self._named_tasks.get(name)
 
     def add_global_error_handler(
         self, handler: Callable[[str, Exception], Awaitable[None]]
@@ -134,22 +161,17 @@ class TaskManager:
 
     def get_running_tasks(self) -> list[asyncio.Task]:
         """Get all currently running (non-done) tasks."""
-        return [t for t in self._tasks if not t.done()]
+        return list(self._running_set)
 
     def get_task_stats(self) -> dict:
-        """Get statistics about tracked tasks."""
-        all_tasks = list(self._tasks)
-        running = [t for t in all_tasks if not t.done()]
-        done = [t for t in all_tasks if t.done()]
-        failed = [t for t in done if not t.cancelled() and t.exception() is not None]
-        cancelled = [t for t in done if t.cancelled()]
-
+        """Get statistics about tracked tasks (counters kept by done-callbacks)."""
+        running = len(self._running_set)
         return {
-            "total_tracked": len(all_tasks),
-            "running": len(running),
-            "completed": len(done) - len(failed) - len(cancelled),
-            "failed": len(failed),
-            "cancelled": len(cancelled),
+            "total_tracked": running + self._completed + self._failed + self._cancelled,
+            "running": running,
+            "completed": self._completed,
+            "failed": self._failed,
+            "cancelled": self._cancelled,
             "named_tasks": list(self._named_tasks.keys()),
         }
 
@@ -163,31 +185,34 @@ class TaskManager:
         Returns:
             Statistics about cancelled tasks
         """
-        running = self.get_running_tasks()
+        running = self._running_set
         if not running:
             return {"cancelled": 0, "timed_out": 0}
 
-        logger.info(f"Cancelling {len(running)} background tasks...")
+        # Snapshot: done-callbacks shrink the running set while we wait
+        tasks = tuple(running)
+        logger.info(f"Cancelling {len(tasks)} background tasks...")
 
         # Cancel all running tasks
-        for task in running:
+        for task in tasks:
             task.cancel()
 
-        # Wait for them to finish
-        done, pending = await asyncio.wait(
-            running,
-            timeout=timeout,
-            return_when=asyncio.ALL_COMPLETED,
-        )
-
-        timed_out = len(pending)
-        if timed_out > 0:
+        # Wait for them to finish. Shielded so a timeout doesn't cancel the
+        # gather (re-cancelling tasks) and block on tasks that ignore it.
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(asyncio.gather(*tasks, return_exceptions=True)),
+                timeout=timeout,
+            )
+            timed_out = 0
+        except asyncio.TimeoutError:
+            timed_out = sum(1 for t in tasks if not t.done())
             logger.warning(
                 f"{timed_out} tasks did not finish within {timeout}s timeout"
             )
 
         return {
-            "cancelled": len(done),
+            "cancelled": len(tasks) - timed_out,
             "timed_out": timed_out,
         }
 
@@ -215,3 +240,6 @@ class TaskManager:
         if timeout:
             return await asyncio.wait_for(task, timeout=timeout)
         return await task
+
+
+TaskManager._instance = TaskManager()
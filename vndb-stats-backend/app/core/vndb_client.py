@@ -31,12 +31,14 @@ Architecture: VNDB Daily Dumps → PostgreSQL (PRIMARY) → Backend API → Fron
 
 import asyncio
 import logging
-from collections import deque
-from time import time
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
 from typing import Any
 from urllib.parse import quote
 
 import httpx
+import orjson
 
 from app.config import get_settings
 from app.core.retry import RetryConfig, async_retry
@@ -46,40 +48,172 @@ settings = get_settings()
 
 
 class RateLimiter:
-    """Token bucket rate limiter for VNDB API."""
+    """Token bucket rate limiter for VNDB API.
+
+    Holds up to ``max_requests`` tokens, refilled continuously at
+    ``max_requests / window_seconds`` per second. State is two scalars, so
+    acquire() is O(1) regardless of how many requests are in the window.
+    """
 
     def __init__(self, max_requests: int = 200, window_seconds: int = 300):
         self.max_requests = max_requests
         self.window = window_seconds
-        self.requests: deque[float] = deque()
-        self._lock = asyncio.Lock()
+        self._cap = float(max_requests)
+        self._rate = max_requests / window_seconds  # Tokens per second
+        self._tokens = float(max_requests)
+        # Event-loop (monotonic) time of the last refill; set on first acquire()
+        # since the limiter may be constructed outside a running loop
+        self._last: float | None = None
+        # Loop time before which no request may start (set by penalize())
+        self._barrier = 0.0
 
     async def acquire(self):
-        """Wait until a request can be made within rate limits."""
-        async with self._lock:
-            while True:
-                now = time()
-
-                # Remove expired timestamps
-                while self.requests and self.requests[0] < now - self.window:
-                    self.requests.popleft()
+        """Wait until a request can be made within rate limits.
 
-                if len(self.requests) < self.max_requests:
-                    # We can make a request - record it and exit
-                    self.requests.append(now)
-                    break
-
-                # Need to wait - calculate sleep time
-                sleep_time = self.requests[0] + self.window - now
-                if sleep_time > 0:
-                    logger.info(f"Rate limit reached, waiting {sleep_time:.2f}s")
-                    await asyncio.sleep(sleep_time)
-                # Loop back to re-check after sleeping
+        No lock needed: the refill/check/take below never awaits, so it runs
+        atomically on the event loop. Only the sleep yields, after which the
+        waiter simply re-checks.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            # loop.time() is monotonic, so clock adjustments can't skew refills
+            now = loop.time()
+            if now < self._barrier:
+                # Server told us to back off (429 Retry-After)
+                await asyncio.sleep(self._barrier - now)
+                continue
+            if self._last is not None:
+                self._tokens = min(self._cap, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+
+            # Need to wait - time until one whole token has refilled
+            sleep_time = (1.0 - self._tokens) / self._rate
+            logger.info(f"Rate limit reached, waiting {sleep_time:.2f}s")
+            await asyncio.sleep(sleep_time)
+            # Loop back to re-check after sleeping
+
+    def penalize(self, seconds: float) -> None:
+        """Block all acquires for `seconds` and drain the bucket (on HTTP 429)."""
+        now = asyncio.get_running_loop().time()
+        self._tokens = 0.0
+        self._last = now + seconds  # Refill restarts once the barrier lifts
+        self._barrier = max(self._barrier, now + seconds)
+        logger.warning(f"VNDB rate limit hit (429), pausing requests for {seconds:.1f}s")
+
+
+def parse_retry_after(value: str | None, default: float = 1.0) -> float:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling VNDB while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the VNDB API is down.
+
+    CLOSED: calls go through. After ``failure_threshold`` consecutive failures
+    the breaker OPENs and rejects calls for ``cooldown_seconds``. It then goes
+    HALF_OPEN and lets a single probe through: success closes it again, failure
+    re-opens it for another cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._state = self.CLOSED
+        self._fail_count = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if the call should not be attempted."""
+        if self._state == self.CLOSED:
+            return
+        if self._state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.cooldown_seconds:
+                raise CircuitOpenError("VNDB API circuit breaker is open")
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        # HALF_OPEN: only one probe at a time
+        if self._probe_in_flight:
+            raise CircuitOpenError("VNDB API circuit breaker is half-open, probe in flight")
+        self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        if self._state != self.CLOSED:
+            logger.info("VNDB API circuit breaker closed - requests resumed")
+        self._state = self.CLOSED
+        self._fail_count = 0
+        self._probe_in_flight = False
+
+    def abandon(self) -> None:
+        """Release a half-open probe slot without recording an outcome."""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._fail_count += 1
+        self._probe_in_flight = False
+        if self._state == self.HALF_OPEN or self._fail_count >= self.failure_threshold:
+            if self._state != self.OPEN:
+                logger.warning(
+                    f"VNDB API circuit breaker OPENED after {self._fail_count} consecutive "
+                    f"failures, rejecting requests for {self.cooldown_seconds:.0f}s"
+                )
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
 
 
 class VNDBClient:
     """Async client for VNDB Kana API with rate limiting."""
 
+    # Shared by every request; the retrying callable is built once per client.
+    # Delays are full-jitter (uniform in [0, min(30, 2**attempt))), so parallel
+    # page fetches that hit the same 5xx don't retry in lockstep.
+    RETRY_CONFIG = RetryConfig(
+        max_attempts=3,
+        base_delay=1.0,
+        max_delay=30.0,
+        retryable_exceptions=(
+            httpx.TimeoutException,
+            httpx.NetworkError,
+            ConnectionError,
+            asyncio.TimeoutError,
+        ),
+        retryable_status_codes=(500, 502, 503, 504, 520, 521, 522, 523, 524),
+        budget_scope="vndb_api",
+    )
+
+    SUPPORTED_METHODS = frozenset({"GET", "POST"})
+
+    # get_user() lookup cache: entry lifetime (seconds) and max entries
+    USER_CACHE_TTL = 3600
+    USER_CACHE_MAX = 10_000
+
     def __init__(self):
         self.base_url = settings.vndb_api_url
         self.token = settings.vndb_api_token
@@ -88,6 +222,11 @@ class VNDBClient:
             window_seconds=settings.vndb_rate_limit_window,
         )
         self._client: httpx.AsyncClient | None = None
+        self.breaker = CircuitBreaker()
+        self._bulkhead = asyncio.Semaphore(settings.vndb_bulkhead_cap)
+        # "name:<lowercased username>" / "uid:<uid>" -> (expires_at, user data)
+        self._user_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._do_request_retried = async_retry(self.RETRY_CONFIG)(self._do_request)
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -96,10 +235,19 @@ class VNDBClient:
             if self.token:
                 headers["Authorization"] = f"Token {self.token}"
 
+            # HTTP/2 multiplexes the parallel page fetches over one connection,
+            # skipping a TCP+TLS handshake per page
+            parallel = settings.vndb_parallel_pages
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 headers=headers,
-                timeout=30.0,
+                timeout=httpx.Timeout(30.0, connect=5.0, write=10.0, pool=5.0),
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=max(20, parallel * 2),
+                    max_keepalive_connections=parallel,
+                    keepalive_expiry=60.0,
+                ),
             )
         return self._client
 
@@ -108,59 +256,77 @@ class VNDBClient:
         if self._client and not self._client.is_closed:
             await self._client.aclose()
 
-    async def _request(
+    async def _do_request(
         self,
         method: str,
         endpoint: str,
         json_data: dict | None = None,
-        max_retries: int = 3,
     ) -> dict:
-        """
-        Make a rate-limited request to VNDB API with automatic retry.
-
-        Retries are performed for transient errors (network issues, timeouts, 5xx).
-        Non-retryable errors (4xx client errors) are raised immediately.
-        """
-        # Configure retry behavior
-        retry_config = RetryConfig(
-            max_attempts=max_retries,
-            base_delay=1.0,
-            max_delay=30.0,
-            retryable_exceptions=(
-                httpx.TimeoutException,
-                httpx.NetworkError,
-                ConnectionError,
-                asyncio.TimeoutError,
-            ),
-            retryable_status_codes=(500, 502, 503, 504, 520, 521, 522, 523, 524),
-        )
-
-        @async_retry(retry_config)
-        async def do_request() -> dict:
-            # Rate limiting happens before each attempt
-            await self.rate_limiter.acquire()
-            client = await self._get_client()
+        """Single rate-limited request attempt (wrapped with retries in __init__)."""
+        # Bulkhead: cap in-flight VNDB calls per process so excess callers
+        # queue on a semaphore instead of all spinning on the rate limiter
+        async with self._bulkhead:
+            # Fail fast during an outage; CircuitOpenError is not retryable
+            self.breaker.before_call()
 
             try:
-                if method == "GET":
-                    response = await client.get(endpoint)
-                elif method == "POST":
-                    response = await client.post(endpoint, json=json_data)
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
+                # Rate limiting happens before each attempt
+                await self.rate_limiter.acquire()
+                client = await self._get_client()
+
+                response = await client.request(method, endpoint, json=json_data)
 
                 response.raise_for_status()
-                return response.json()
+                # orjson parses the raw body bytes directly (no str decode step) and
+                # is several times faster than stdlib json on dict-heavy ulist pages
+                result = orjson.loads(response.content)
 
             except httpx.HTTPStatusError as e:
                 # Log the error (retry decorator will handle retryable ones)
                 logger.warning(
                     f"VNDB API error: {e.response.status_code} - {e.response.text[:200]}"
                 )
+                if e.response.status_code == 429:
+                    self.rate_limiter.penalize(
+                        parse_retry_after(e.response.headers.get("Retry-After"))
+                    )
+                # Only server-side errors say VNDB is unhealthy; 4xx means it answered
+                if e.response.status_code in self.RETRY_CONFIG.retryable_status_codes:
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
+                raise
+            except self.RETRY_CONFIG.retryable_exceptions:
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Anything else (cancellation, bad arguments) says nothing about
+                # VNDB's health; just release a half-open probe slot
+                self.breaker.abandon()
                 raise
 
+            self.breaker.record_success()
+            return result
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: dict | None = None,
+    ) -> dict:
+        """
+        Make a rate-limited request to VNDB API with automatic retry.
+
+        Retries are performed for transient errors (network issues, timeouts, 5xx).
+        Non-retryable errors (4xx client errors) are raised immediately.
+        """
+        # Validated once here rather than on every attempt, and before a
+        # rate-limit token or bulkhead slot is spent on it
+        if method not in self.SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+
         try:
-            return await do_request()
+            return await self._do_request_retried(method, endpoint, json_data)
         except Exception as e:
             logger.error(f"VNDB API request failed after retries: {endpoint} - {e}")
             raise
@@ -170,7 +336,37 @@ class VNDBClient:
         return await self._request("GET", "/stats")
 
     async def get_user(self, username: str | None = None, uid: str | None = None) -> dict | None:
-        """Look up a user by username or UID."""
+        """Look up a user by username or UID.
+
+        Successful lookups are kept in a small in-process TTL/LRU cache since
+        username <-> UID mappings rarely change and each miss costs a rate-limit slot.
+        """
+        if username:
+            key = f"name:{username.lower()}"
+        elif uid:
+            key = f"uid:{uid}"
+        else:
+            key = None
+
+        now = time.monotonic()
+        if key is not None:
+            cached = self._user_cache.get(key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._user_cache.move_to_end(key)
+                    return cached[1]
+                del self._user_cache[key]
+
+        user_data = await self._fetch_user(username=username, uid=uid)
+
+        if key is not None and user_data:
+            self._user_cache[key] = (now + self.USER_CACHE_TTL, user_data)
+            if len(self._user_cache) > self.USER_CACHE_MAX:
+                self._user_cache.popitem(last=False)
+        return user_data
+
+    async def _fetch_user(self, username: str | None = None, uid: str | None = None) -> dict | None:
+        """Look up a user by username or UID via the VNDB API."""
         params = []
         if username:
             # URL-encode so a username can't inject extra query params into the call.
@@ -381,21 +577,43 @@ class VNDBClient:
         fields: str = "id,title,rating,released,image.url,tags.rating",
     ) -> list[dict]:
         """Get VN details by IDs."""
+        # Duplicate IDs would only spend extra rate-limit slots on repeat rows
+        vn_ids = list(dict.fromkeys(vn_ids))
         if not vn_ids:
             return []
 
-        # VNDB accepts up to 100 IDs at a time
-        all_results = []
+        # VNDB accepts up to 100 IDs at a time; fetch the batches concurrently,
+        # at most vndb_parallel_pages in flight (same cap as user list paging)
+        semaphore = asyncio.Semaphore(settings.vndb_parallel_pages)
+
+        async def fetch_batch(batch: list[str]) -> dict:
+            async with semaphore:
+                return await self.query_vn(
+                    filters=["or"] + [["id", "=", vid] for vid in batch],
+                    fields=fields,
+                    results=100,
+                )
+
+        batch_results = await asyncio.gather(
+            *(fetch_batch(vn_ids[i:i + 100]) for i in range(0, len(vn_ids), 100)),
+            return_exceptions=True,
+        )
 
-        for i in range(0, len(vn_ids), 100):
-            batch = vn_ids[i:i + 100]
-            filters = ["or"] + [["id", "=", vid] for vid in batch]
+        # Any failed batch fails the call, as when batches ran one by one:
+        # callers cache the result and can't tell a partial list from a full
+        # one. Gathering with return_exceptions lets the other batches finish
+        # rather than leaving them running unobserved. BaseException also
+        # covers a cancelled batch (CancelledError is not an Exception).
+        failures = [
+            (i, r) for i, r in enumerate(batch_results) if isinstance(r, BaseException)
+        ]
+        if failures:
+            for i, error in failures:
+                logger.warning(f"Failed to fetch VN batch {i + 1}/{len(batch_results)}: {error!r}")
+            raise failures[0][1]
 
-            result = await self.query_vn(
-                filters=filters,
-                fields=fields,
-                results=100,
-            )
+        all_results = []
+        for result in batch_results:
             all_results.extend(result.get("results", []))
 
         return all_results
@@ -60,30 +60,67 @@ async def get_database_status() -> dict:
         - last_import: str - ISO timestamp of last import
         - last_import_age_hours: float - Hours since last import
         - needs_import: bool - True if database is empty
-        - table_counts: dict - Row counts for key tables
+        - table_counts: dict - Row counts for key tables (exact for
+          visual_novels, pg_class planner estimates for the rest)
         - schema_version: str - Current Alembic revision (if available)
     """
     try:
         async with async_session_maker() as session:
             result = {}
 
-            # Get VN count (primary indicator)
-            vn_result = await session.execute(
-                select(func.count()).select_from(VisualNovel)
-            )
-            vn_count = vn_result.scalar_one_or_none() or 0
+            # Exact VN count (the primary indicator) and last import timestamp
+            # in one round trip, as scalar subqueries of a single SELECT
+            status_row = (await session.execute(
+                select(
+                    select(func.count()).select_from(VisualNovel).scalar_subquery(),
+                    select(SystemMetadata.value)
+                    .where(SystemMetadata.key == "last_import")
+                    .scalar_subquery(),
+                )
+            )).one()
+            vn_count = status_row[0] or 0
+            last_import = status_row[1]
             result["vn_count"] = vn_count
             result["has_data"] = vn_count > 0
             result["needs_import"] = vn_count == 0
-
-            # Get last import timestamp
-            meta_result = await session.execute(
-                select(SystemMetadata).where(SystemMetadata.key == "last_import")
-            )
-            metadata = meta_result.scalar_one_or_none()
-            last_import = metadata.value if metadata else None
             result["last_import"] = last_import
 
+            # The other table counts are only a "data present?" diagnostic, so
+            # use the planner's row estimates from pg_class (a catalog lookup)
+            # instead of COUNT(*) scans over millions of vote/tag rows
+            table_counts = {"visual_novels": vn_count}
+            estimates = {}
+            try:
+                estimate_result = await session.execute(
+                    text(
+                        "SELECT relname, reltuples::bigint FROM pg_class "
+                        "WHERE relname = ANY(:names) AND pg_table_is_visible(oid)"
+                    ),
+                    {"names": [name for name, _ in IMPORT_TABLES]},
+                )
+                estimates = dict(estimate_result.all())
+            except Exception as e:
+                logger.warning(f"Could not read pg_class row estimates: {e}")
+                await session.rollback()
+
+            for table_name, model in IMPORT_TABLES:
+                if table_name in table_counts:
+                    continue
+                estimate = estimates.get(table_name)
+                # reltuples is -1 until the table is first vacuumed/analyzed;
+                # count exactly in that case
+                if estimate is not None and estimate >= 0:
+                    table_counts[table_name] = estimate
+                    continue
+                try:
+                    count_result = await session.execute(
+                        select(func.count()).select_from(model)
+                    )
+                    table_counts[table_name] = count_result.scalar_one_or_none() or 0
+                except Exception as table_error:
+                    await session.rollback()
+                    table_counts[table_name] = f"error: {table_error}"
+
             # Calculate age
             if last_import:
                 try:
@@ -99,16 +136,6 @@ async def get_database_status() -> dict:
             else:
                 result["last_import_age_hours"] = None
 
-            # Get table counts for key tables
-            table_counts = {}
-            for table_name, model in IMPORT_TABLES:
-                try:
-                    count_result = await session.execute(
-                        select(func.count()).select_from(model)
-                    )
-                    table_counts[table_name] = count_result.scalar_one_or_none() or 0
-                except Exception as e:
-                    table_counts[table_name] = f"error: {e}"
             result["table_counts"] = table_counts
 
             # Try to get Alembic revision
@@ -34,17 +34,31 @@ Data flow: VNDB Dumps → importer.py → THIS DATABASE → API endpoints → Fr
 ============================================================================
 """
 
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
 from sqlalchemy import (
     Column, String, Integer, Float, Boolean, Text, Date, DateTime,
-    ForeignKey, ARRAY, JSON, Index, BigInteger, SmallInteger, CheckConstraint,
-    UniqueConstraint, text, func
+    ForeignKey, ARRAY, JSON, Index, BigInteger, SmallInteger, CheckConstraint, LargeBinary,
+    UniqueConstraint, text, func, event
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 
 from app.db.database import Base
 
+# Table options for precomputed tables (similarities, CF factors, embeddings,
+# recommendation cache). They are rebuilt wholesale from the base tables on a
+# schedule, so they skip WAL: UNLOGGED makes the TRUNCATE + COPY rebuilds much
+# cheaper, at the cost of the tables coming back empty after a crash until the
+# next rebuild. Heap fillfactor is already 100 by default.
+DERIVED_TABLE_ARGS = {"prefixes": ["UNLOGGED"]}
+
+# Database-side UTC "now" for naive (timestamp without time zone) columns,
+# matching the datetime.utcnow() values the rest of the code compares against.
+# Evaluated once per statement by Postgres instead of a Python callback per
+# row, which matters for the multi-row VN upserts during imports.
+UTC_NOW = func.timezone("utc", func.now())
+UTC_NOW_DEFAULT = text("timezone('utc', now())")
+
 
 class VisualNovel(Base):
     """Visual novel metadata from VNDB dumps."""
@@ -59,7 +73,7 @@ class VisualNovel(Base):
     description = Column(Text)
     image_url = Column(String(500))
     image_sexual = Column(Float)  # 0=safe, 1=suggestive, 2=explicit
-    length = Column(Integer)  # 1-5 scale (legacy category value)
+    length = Column(SmallInteger)  # 1-5 scale (legacy category value)
     length_minutes = Column(Integer)  # Average playtime from user votes (matches VNDB website)
     released = Column(Date)
     languages = Column(ARRAY(String(10)))
@@ -69,14 +83,18 @@ class VisualNovel(Base):
     average_rating = Column(Float)  # Raw average from global_votes (not Bayesian-adjusted)
     votecount = Column(Integer, default=0)
     popularity = Column(Integer, default=0)
-    minage = Column(Integer)  # Minimum age: 0, 6, 12, 15, 16, 17, 18
-    devstatus = Column(Integer)  # Development status: 0=finished, 1=in dev, 2=cancelled
+    minage = Column(SmallInteger)  # Minimum age: 0, 6, 12, 15, 16, 17, 18
+    devstatus = Column(SmallInteger)  # Development status: 0=finished, 1=in dev, 2=cancelled
     olang = Column(String(10))  # Original language
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UTC_NOW_DEFAULT)
+    updated_at = Column(DateTime, server_default=UTC_NOW_DEFAULT, onupdate=UTC_NOW)
 
     # Relationships
-    tags = relationship("VNTag", back_populates="visual_novel", cascade="all, delete-orphan")
+    # lazy="raise": an implicit lazy load here would be an N+1 over vn_tags (and
+    # fails under asyncio anyway); queries that need tags must load them explicitly
+    tags = relationship(
+        "VNTag", back_populates="visual_novel", cascade="all, delete-orphan", lazy="raise",
+    )
 
     __table_args__ = (
         Index("idx_vn_released", "released"),
@@ -92,6 +110,24 @@ class VisualNovel(Base):
     )
 
 
+# IMMUTABLE wrapper for the alias search text. array_to_string() is only STABLE
+# (array element output in general may depend on settings), so Postgres rejects
+# it in index expressions; for text[] the output is fixed, which makes the
+# trigram indexes on VN aliases (migration 049) possible. create_all needs it
+# too, since the browse search calls it.
+VN_ALIASES_TEXT_FUNCTION = """
+CREATE OR REPLACE FUNCTION vn_aliases_text(text[]) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$ SELECT array_to_string(COALESCE($1, '{}'::text[]), ' ') $$
+"""
+
+
+@event.listens_for(VisualNovel.__table__, "before_create")
+def _create_vn_aliases_text_function(target, connection, **kw):
+    """Create vn_aliases_text() when create_all builds a fresh database."""
+    connection.execute(text(VN_ALIASES_TEXT_FUNCTION))
+
+
 class Tag(Base):
     """Tags from VNDB tag dump."""
 
@@ -109,7 +145,7 @@ class Tag(Base):
 
     # Relationships
     parent = relationship("Tag", remote_side=[id])
-    vn_tags = relationship("VNTag", back_populates="tag")
+    vn_tags = relationship("VNTag", back_populates="tag", lazy="raise")
 
     __table_args__ = (
         Index("idx_tags_category", "category"),
@@ -138,7 +174,7 @@ class VNTag(Base):
     vn_id = Column(String(10), ForeignKey("visual_novels.id", ondelete="CASCADE"), primary_key=True)
     tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
     score = Column(Float)  # 0-3 relevance score
-    spoiler_level = Column(Integer, default=0)  # 0=none, 1=minor, 2=major
+    spoiler_level = Column(SmallInteger, default=0)  # 0=none, 1=minor, 2=major
     lie = Column(Boolean, default=False)  # True if tag is disputed/incorrect (aggregate of lie votes)
 
     # Relationships
@@ -147,12 +183,19 @@ class VNTag(Base):
 
     __table_args__ = (
         Index("idx_vn_tags_tag", "tag_id"),
-        Index("idx_vn_tags_vn", "vn_id"),
         Index("idx_vn_tags_vn_spoiler", "vn_id", "spoiler_level"),  # Composite for filtered queries
         # Optimize tag analytics queries (score > 0 filter)
         Index("idx_vn_tags_vn_score_spoiler", "vn_id", "score", "spoiler_level"),
         Index("idx_vn_tags_tag_spoiler_score", "tag_id", "spoiler_level", "score"),
-        Index("idx_vn_tags_tag_lie", "tag_id", "lie"),  # For filtering out lie tags
+        # Per-tag lookups and tag analytics always exclude lie tags and zero
+        # scores; the partial index matches that predicate exactly, and the
+        # INCLUDE columns let the (parameterized) spoiler filter and score
+        # reads run as an index-only scan
+        Index(
+            "idx_vn_tags_analytics", "tag_id", "vn_id",
+            postgresql_include=["score", "spoiler_level"],
+            postgresql_where=text("NOT lie AND score > 0"),
+        ),
     )
 
 
@@ -163,15 +206,33 @@ class GlobalVote(Base):
 
     vn_id = Column(String(10), ForeignKey("visual_novels.id", ondelete="CASCADE"), primary_key=True)
     user_hash = Column(String(64), primary_key=True)  # Anonymized user ID
-    vote = Column(Integer, nullable=False)  # 10-100
+    vote = Column(SmallInteger, nullable=False)  # 10-100
     date = Column(Date)
 
     __table_args__ = (
+        CheckConstraint("vote BETWEEN 10 AND 100", name="ck_global_votes_vote_range"),
         Index("idx_global_votes_vn", "vn_id"),
         Index("idx_global_votes_user", "user_hash"),
+        # Hash-partitioned so full scans (CF training, graph building) can run
+        # as parallel per-partition scans and per-VN lookups prune to one
+        # partition. Partitions are created by the after_create hook below.
+        {"postgresql_partition_by": "HASH (vn_id)"},
     )
 
 
+GLOBAL_VOTES_PARTITIONS = 16
+
+
+@event.listens_for(GlobalVote.__table__, "after_create")
+def _create_global_votes_partitions(target, connection, **kw):
+    """Create the hash partitions when create_all builds a fresh database."""
+    for i in range(GLOBAL_VOTES_PARTITIONS):
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {target.name}_p{i} PARTITION OF {target.name} "
+            f"FOR VALUES WITH (MODULUS {GLOBAL_VOTES_PARTITIONS}, REMAINDER {i})"
+        ))
+
+
 # ============ User List Data from VNDB Dumps ============
 
 class UlistVN(Base):
@@ -197,7 +258,12 @@ class UlistVN(Base):
     notes = Column(Text)  # User notes
 
     __table_args__ = (
-        Index("idx_ulist_vns_uid", "uid"),
+        # Covering index for per-user list reads: index-only scans return
+        # vote/vote_date/finished without heap fetches. Also serves uid lookups.
+        Index(
+            "idx_ulist_vns_uid_vid_vote", "uid", "vid", "vote",
+            postgresql_include=["vote_date", "finished"],
+        ),
         Index("idx_ulist_vns_vid", "vid"),
         Index("idx_ulist_vns_vote", "vote"),
     )
@@ -224,7 +290,6 @@ class UlistLabel(Base):
     label = Column(SmallInteger, primary_key=True)  # Label ID (1-6 standard, 10+ custom)
 
     __table_args__ = (
-        Index("idx_ulist_labels_uid", "uid"),
         Index("idx_ulist_labels_uid_label", "uid", "label"),  # For filtering by label
     )
 
@@ -241,30 +306,14 @@ class VndbUser(Base):
     username = Column(String(100), nullable=False)
 
 
-class CachedUserList(Base):
-    """Cached user list data fetched from VNDB API.
-
-    DEPRECATED: This table was used when user lists were fetched from the API.
-    Now user lists come from the ulist_vns and ulist_labels tables (dump data).
-    Kept for backwards compatibility during migration.
-    """
-
-    __tablename__ = "cached_user_lists"
-
-    vndb_uid = Column(String(20), primary_key=True)
-    username = Column(String(100))
-    list_data = Column(JSONB, nullable=False)  # Full user list
-    vote_data = Column(JSONB)  # User votes
-    fetched_at = Column(DateTime, nullable=False)
-    expires_at = Column(DateTime, nullable=False)
-
-
 class UserStatsCache(Base):
     """Precomputed stats cache for users."""
 
     __tablename__ = "user_stats_cache"
 
-    vndb_uid = Column(String(20), ForeignKey("cached_user_lists.vndb_uid"), primary_key=True)
+    # No FK: vndb_users is replaced by a table rename on every dump import,
+    # which would drag the constraint onto the staging table and block TRUNCATE
+    vndb_uid = Column(String(20), primary_key=True)
     stats_json = Column(JSONB, nullable=False)
     computed_at = Column(DateTime, nullable=False)
 
@@ -278,6 +327,8 @@ class CFUserFactors(Base):
     factors = Column(ARRAY(Float), nullable=False)
     computed_at = Column(DateTime, nullable=False)
 
+    __table_args__ = DERIVED_TABLE_ARGS
+
 
 class CFVNFactors(Base):
     """Collaborative filtering VN latent factors."""
@@ -288,6 +339,8 @@ class CFVNFactors(Base):
     factors = Column(ARRAY(Float), nullable=False)
     computed_at = Column(DateTime, nullable=False)
 
+    __table_args__ = DERIVED_TABLE_ARGS
+
 
 class TagVNVector(Base):
     """Precomputed TF-IDF weighted tag vectors for VNs."""
@@ -298,6 +351,8 @@ class TagVNVector(Base):
     tag_vector = Column(ARRAY(Float), nullable=False)
     computed_at = Column(DateTime, nullable=False)
 
+    __table_args__ = DERIVED_TABLE_ARGS
+
 
 # ============ Graph Neural Network Embeddings ============
 
@@ -317,6 +372,7 @@ class UserGraphEmbedding(Base):
 
     __table_args__ = (
         Index("idx_user_graph_embed_version", "model_version"),
+        DERIVED_TABLE_ARGS,
     )
 
 
@@ -336,6 +392,7 @@ class VNGraphEmbedding(Base):
 
     __table_args__ = (
         Index("idx_vn_graph_embed_version", "model_version"),
+        DERIVED_TABLE_ARGS,
     )
 
 
@@ -346,7 +403,7 @@ class SystemMetadata(Base):
 
     key = Column(String(100), primary_key=True)
     value = Column(Text)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, server_default=UTC_NOW_DEFAULT, onupdate=UTC_NOW)
 
 
 # ============ Producer / Developer / Publisher Models ============
@@ -413,7 +470,6 @@ class VNStaff(Base):
     note = Column(String(500))
 
     __table_args__ = (
-        Index("idx_vn_staff_vn", "vn_id"),
         Index("idx_vn_staff_staff", "staff_id"),
         Index("idx_vn_staff_role", "role"),
         Index("idx_vn_staff_vn_role", "vn_id", "role"),  # Composite for role filtering
@@ -454,7 +510,12 @@ class VNRelation(Base):
     official = Column(Boolean, default=True)
 
     __table_args__ = (
-        Index("idx_vn_relations_vn", "vn_id"),
+        # Covering index for "relations of VN X" (optionally filtered by
+        # relation type): index-only scan, no heap fetch for the target id
+        Index(
+            "idx_vn_relations_vn_rel", "vn_id", "relation",
+            postgresql_include=["related_vn_id", "official"],
+        ),
         Index("idx_vn_relations_related", "related_vn_id"),
     )
 
@@ -533,7 +594,7 @@ class CharacterVN(Base):
     character_id = Column(String(10), ForeignKey("characters.id", ondelete="CASCADE"), primary_key=True)
     vn_id = Column(String(10), ForeignKey("visual_novels.id", ondelete="CASCADE"), primary_key=True)
     role = Column(String(20))  # "main", "primary", "side", "appears"
-    spoiler_level = Column(Integer, default=0)  # 0=none, 1=minor, 2=major
+    spoiler_level = Column(SmallInteger, default=0)  # 0=none, 1=minor, 2=major
     release_id = Column(String(10))
 
     __table_args__ = (
@@ -549,10 +610,9 @@ class CharacterTrait(Base):
 
     character_id = Column(String(10), ForeignKey("characters.id", ondelete="CASCADE"), primary_key=True)
     trait_id = Column(Integer, ForeignKey("traits.id", ondelete="CASCADE"), primary_key=True)
-    spoiler_level = Column(Integer, default=0)  # 0=none, 1=minor, 2=major
+    spoiler_level = Column(SmallInteger, default=0)  # 0=none, 1=minor, 2=major
 
     __table_args__ = (
-        Index("idx_character_traits_char", "character_id"),
         Index("idx_character_traits_trait", "trait_id"),
         Index("idx_character_traits_char_spoiler", "character_id", "spoiler_level"),  # Composite for filtered queries
     )
@@ -587,8 +647,6 @@ class Release(Base):
 
     __table_args__ = (
         Index("idx_releases_released", "released"),
-        Index("idx_releases_patch", "patch"),
-        Index("idx_releases_freeware", "freeware"),
     )
 
 
@@ -602,7 +660,6 @@ class ReleaseVN(Base):
     rtype = Column(String(20))  # "complete", "partial", "trial" - KEY for filtering
 
     __table_args__ = (
-        Index("idx_release_vn_vn", "vn_id"),
         Index("idx_release_vn_release", "release_id"),
         Index("idx_release_vn_rtype", "rtype"),  # For filtering by release type
         Index("idx_release_vn_vn_rtype", "vn_id", "rtype"),  # Composite for VN + type queries
@@ -744,9 +801,12 @@ class NewsItem(Base):
     is_hidden = Column(Boolean, default=False)  # Admin moderation flag
 
     __table_args__ = (
-        Index("idx_news_source", "source"),
         Index("idx_news_published", published_at.desc()),
-        Index("idx_news_hidden", "is_hidden"),
+        # Every public feed query filters is_hidden = false and orders by date
+        Index(
+            "idx_news_visible_published", published_at.desc(),
+            postgresql_where=text("NOT is_hidden"),
+        ),
         Index("idx_news_source_published", "source", published_at.desc()),
     )
 
@@ -767,7 +827,10 @@ class Announcement(Base):
     created_by = Column(String(100))  # Admin username
 
     __table_args__ = (
-        Index("idx_announcements_active", "is_active"),
+        Index(
+            "idx_announcements_live", "expires_at",
+            postgresql_where=text("is_active"),
+        ),
         Index("idx_announcements_expires", "expires_at"),
     )
 
@@ -940,7 +1003,13 @@ class PostedItemsTracker(Base):
     posted_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
     __table_args__ = (
-        Index("idx_posted_items_date", "posted_at"),
+        # Rows are appended in posted_at order and only ever range-deleted by
+        # the retention cleanup, so a BRIN index (a few pages) replaces the B-tree
+        Index(
+            "idx_posted_items_date_brin", "posted_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -962,6 +1031,7 @@ class VNSimilarity(Base):
     __table_args__ = (
         Index("idx_vn_sim_vn", "vn_id"),
         Index("idx_vn_sim_score", "vn_id", similarity_score.desc()),
+        DERIVED_TABLE_ARGS,
     )
 
 
@@ -989,8 +1059,8 @@ class UserRecommendationCache(Base):
     updated_at = Column(DateTime, nullable=False)
 
     __table_args__ = (
-        Index("idx_user_rec_user", "user_id"),
         Index("idx_user_rec_score", "user_id", combined_score.desc()),
+        DERIVED_TABLE_ARGS,
     )
 
 
@@ -1010,8 +1080,13 @@ class VNCoOccurrence(Base):
     computed_at = Column(DateTime, nullable=False)
 
     __table_args__ = (
-        Index("idx_vn_cooccur_vn", "vn_id"),
-        Index("idx_vn_cooccur_score", "vn_id", co_rating_score.desc()),
+        # Covering: "users also read" lookups are index-only scans. The trainer
+        # recreates this on the staging table each run (swap_similarity_tables)
+        Index(
+            "idx_vn_cooccur_score", "vn_id", co_rating_score.desc(),
+            postgresql_include=["similar_vn_id", "user_count"],
+        ),
+        DERIVED_TABLE_ARGS,
     )
 
 
@@ -1034,11 +1109,18 @@ class ImportRun(Base):
     triggered_by = Column(String(50), default="scheduled")  # scheduled, manual, api
     stats_json = Column(JSONB)  # {"vns_imported": 50000, "votes_imported": 10000000, ...}
 
-    logs = relationship("ImportLog", back_populates="run", cascade="all, delete-orphan")
+    # Runs are listed without their logs (often thousands per run), which are
+    # paged separately; lazy="raise" makes an accidental per-run load fail loudly
+    logs = relationship("ImportLog", back_populates="run", cascade="all, delete-orphan", lazy="raise")
 
     __table_args__ = (
         Index("idx_import_runs_status", "status"),
         Index("idx_import_runs_started", started_at.desc()),
+        # Dashboard polling for the active run: only non-terminal rows are indexed
+        Index(
+            "idx_import_runs_active", started_at.desc(),
+            postgresql_where=text("status IN ('running', 'pending')"),
+        ),
     )
 
 
@@ -1060,7 +1142,18 @@ class ImportLog(Base):
     __table_args__ = (
         Index("idx_import_logs_run", "run_id"),
         Index("idx_import_logs_level", "level"),
-        Index("idx_import_logs_timestamp", "timestamp"),
+        # "Errors for this run" in the admin log viewer, already in display order
+        Index(
+            "idx_import_logs_run_errors", "run_id", "timestamp",
+            postgresql_where=text("level = 'ERROR'"),
+        ),
+        # Append-only, so timestamp follows physical order; per-run reads go
+        # through run_id, leaving only time-range scans for this one
+        Index(
+            "idx_import_logs_timestamp_brin", "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
 
@@ -1072,7 +1165,8 @@ class AppLog(Base):
     __tablename__ = "app_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    # Part of the primary key because the table is range-partitioned on it
+    timestamp = Column(DateTime(timezone=True), primary_key=True, nullable=False, default=datetime.utcnow)
     level = Column(String(10), nullable=False)  # DEBUG, INFO, WARNING, ERROR
     source = Column(String(20), nullable=False)  # "backend" or "frontend"
     module = Column(String(200))  # Logger name / component name
@@ -1084,7 +1178,7 @@ class AppLog(Base):
     stack_trace = Column(Text)
 
     # Error grouping (for deduplication)
-    error_hash = Column(String(64), index=True)  # SHA256 of normalized error
+    error_hash = Column(LargeBinary(16))  # First 128 bits of SHA256 of normalized error
     occurrence_count = Column(Integer, default=1)  # Number of occurrences
     first_seen = Column(DateTime(timezone=True))
     last_seen = Column(DateTime(timezone=True))
@@ -1098,11 +1192,41 @@ class AppLog(Base):
     __table_args__ = (
         Index("idx_app_logs_timestamp", timestamp.desc()),
         Index("idx_app_logs_source_level", "source", "level"),
-        Index("idx_app_logs_level", "level"),
-        Index("idx_app_logs_source", "source"),
+        # Recent-errors widget: WHERE level = 'ERROR' ORDER BY timestamp DESC LIMIT n
+        Index("idx_app_logs_level_timestamp", "level", timestamp.desc()),
+        # Frontend error dedup: newest row with this hash in the last hour
+        Index("idx_app_logs_hash_timestamp", "error_hash", timestamp.desc()),
+        # Daily range partitions: retention drops whole partitions instead of
+        # DELETEing rows (see app.logging.cleanup), and time-window queries prune
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
+
+
+# Daily partitions are created this many days ahead by the log cleanup job;
+# rows outside every daily partition land in app_logs_default
+APP_LOGS_PARTITION_DAYS_AHEAD = 7
+
+
+def app_logs_partition_ddl(day: date) -> str:
+    """DDL creating the app_logs partition for one UTC day (no-op if it exists)."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS app_logs_p{day:%Y%m%d} PARTITION OF app_logs "
+        f"FOR VALUES FROM ('{day.isoformat()} 00:00:00+00') "
+        f"TO ('{(day + timedelta(days=1)).isoformat()} 00:00:00+00')"
     )
 
 
+@event.listens_for(AppLog.__table__, "after_create")
+def _create_app_logs_partitions(target, connection, **kw):
+    """Create the default and upcoming daily partitions on a fresh database."""
+    connection.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {target.name}_default PARTITION OF {target.name} DEFAULT"
+    ))
+    today = datetime.now(timezone.utc).date()
+    for offset in range(APP_LOGS_PARTITION_DAYS_AHEAD + 1):
+        connection.execute(text(app_logs_partition_ddl(today + timedelta(days=offset))))
+
+
 # ============ Cover Blacklist Models ============
 
 class CoverBlacklistConfig(Base):
@@ -1132,9 +1256,10 @@ class CoverBlacklistConfig(Base):
     updated_at = Column(DateTime(timezone=True))
 
     # Relationships
-    tag = relationship("Tag", foreign_keys=[tag_id])
-    tag2 = relationship("Tag", foreign_keys=[tag_id_2])
-    tag3 = relationship("Tag", foreign_keys=[tag_id_3])
+    # Routes join Tag explicitly; never lazy-load per rule
+    tag = relationship("Tag", foreign_keys=[tag_id], lazy="raise")
+    tag2 = relationship("Tag", foreign_keys=[tag_id_2], lazy="raise")
+    tag3 = relationship("Tag", foreign_keys=[tag_id_3], lazy="raise")
 
     @property
     def tag_ids_list(self) -> list[int]:
@@ -1149,7 +1274,8 @@ class CoverBlacklistConfig(Base):
 
     __table_args__ = (
         Index("idx_blacklist_config_tag", "tag_id"),
-        Index("idx_blacklist_config_active", "is_active"),
+        # Only the active rules are ever looked up by activity
+        Index("idx_blacklist_config_active", "id", postgresql_where=text("is_active")),
         CheckConstraint(
             "tag_id IS NOT NULL OR age_condition IS NOT NULL",
             name="ck_blacklist_config_has_condition",
@@ -1175,7 +1301,7 @@ class CoverBlacklist(Base):
     notes = Column(Text)
 
     # Relationship
-    visual_novel = relationship("VisualNovel")
+    visual_novel = relationship("VisualNovel", lazy="raise")
 
     __table_args__ = (
         Index("idx_cover_blacklist_reason", "reason"),
@@ -1,6 +1,8 @@
 """Pydantic schemas for API request/response validation."""
 
 from datetime import date, datetime
+from typing import Annotated, Any, Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -46,7 +48,7 @@ class UserVNListItem(BaseModel):
     """Single VN in user's list with metadata."""
     id: str  # VN ID
     vote: int | None = None  # User's vote (10-100 scale)
-    labels: list[UserVNListItemLabel] = []
+    labels: list[UserVNListItemLabel] = Field(default_factory=list)
     added: int | None = None  # Unix timestamp
     started: str | None = None  # ISO date
     finished: str | None = None  # ISO date
@@ -114,6 +116,56 @@ class UserInfo(BaseModel):
     username: str
 
 
+# ============ User Stats Breakdown Schemas ============
+
+class ProducerBreakdown(BaseModel):
+    """Developer or publisher statistics for a user."""
+    id: str  # e.g., "p1"
+    name: str
+    original: str | None = None  # Romanized/latin name
+    type: str | None  # "co" (company), "in" (individual), "ng" (amateur group)
+    count: int  # Number of VNs from this producer
+    avg_rating: float  # User's average rating for VNs from this producer
+    global_avg_rating: float | None = None  # Global average rating for VNs from this producer
+    weighted_score: float | None = None  # Bayesian-weighted score for ranking
+
+
+class StaffBreakdown(BaseModel):
+    """Staff member statistics for a user."""
+    id: str  # e.g., "s1"
+    name: str
+    original: str | None = None  # Romanized/latin name
+    role: str  # "scenario", "art", "music", "songs", "director"
+    count: int  # Number of VNs this staff worked on
+    avg_rating: float  # User's average rating for VNs this staff worked on
+    global_avg_rating: float | None = None  # Global average rating for VNs this staff worked on
+    weighted_score: float | None = None  # Bayesian-weighted score for ranking
+
+
+class SeiyuuBreakdown(BaseModel):
+    """Voice actor (seiyuu) statistics for a user."""
+    id: str  # Staff ID, e.g., "s1"
+    name: str
+    original: str | None = None  # Romanized/latin name
+    count: int  # Number of VNs this seiyuu voiced in
+    avg_rating: float  # User's average rating for VNs this seiyuu voiced in
+    global_avg_rating: float | None = None  # Global average rating for VNs this seiyuu voiced in
+    weighted_score: float | None = None  # Bayesian-weighted score for ranking
+
+
+class TraitBreakdown(BaseModel):
+    """Character trait statistics for a user."""
+    id: int
+    name: str
+    group_name: str | None  # Trait category (e.g., "Hair", "Eyes", "Personality")
+    count: int  # Number of characters with this trait in user's VNs
+    vn_count: int  # Number of VNs with characters having this trait
+    frequency: float  # Percentage of user's VNs that have this trait (0-100)
+    avg_rating: float | None = None  # User's average rating for VNs with this trait
+    global_avg_rating: float | None = None  # Global average rating for VNs with this trait
+    weighted_score: float | None = None  # Bayesian-weighted score for ranking
+
+
 class UserStatsResponse(BaseModel):
     """Complete user statistics response."""
     user: UserInfo
@@ -127,12 +179,12 @@ class UserStatsResponse(BaseModel):
     length_distribution_detailed: dict[str, CategoryStats] | None = None  # with avg ratings
     age_rating_distribution: dict[str, CategoryStats] | None = None  # with avg ratings
     release_year_with_ratings: list[YearWithRating] | None = None  # for dual-axis chart
-    # Detailed breakdowns for tabs (using forward references for schemas defined later)
-    developers_breakdown: list["ProducerBreakdown"] | None = None
-    publishers_breakdown: list["ProducerBreakdown"] | None = None
-    staff_breakdown: list["StaffBreakdown"] | None = None
-    seiyuu_breakdown: list["SeiyuuBreakdown"] | None = None
-    traits_breakdown: list["TraitBreakdown"] | None = None
+    # Detailed breakdowns for tabs
+    developers_breakdown: list[ProducerBreakdown] | None = None
+    publishers_breakdown: list[ProducerBreakdown] | None = None
+    staff_breakdown: list[StaffBreakdown] | None = None
+    seiyuu_breakdown: list[SeiyuuBreakdown] | None = None
+    traits_breakdown: list[TraitBreakdown] | None = None
     last_updated: datetime | None = None  # When this data was last refreshed
 
 
@@ -155,12 +207,24 @@ class TagPreference(BaseModel):
     global_avg: float
 
 
+class TagPreferences(BaseModel):
+    """Tags a user rates well above or below the global average."""
+    loved: list[TagPreference] = Field(default_factory=list)
+    avoided: list[TagPreference] = Field(default_factory=list)
+
+
+class TagComparisonToGlobal(BaseModel):
+    """Names of the top loved/avoided tags, for display."""
+    more_than_average: list[str] = Field(default_factory=list)
+    less_than_average: list[str] = Field(default_factory=list)
+
+
 class TagAnalyticsResponse(BaseModel):
     """Tag analytics for a user."""
     top_tags: list[TagStats]
-    tag_preferences: dict[str, list[TagPreference]]  # "loved" and "avoided"
+    tag_preferences: TagPreferences
     tag_trends: list[dict]
-    tag_comparison_to_global: dict[str, list[str]]
+    tag_comparison_to_global: TagComparisonToGlobal
 
 
 class SharedVNScore(BaseModel):
@@ -172,6 +236,12 @@ class SharedVNScore(BaseModel):
     user2_score: float
 
 
+class DifferingTastes(BaseModel):
+    """Tags one user of a comparison rates notably higher than the other."""
+    user1_prefers: list[str] = Field(default_factory=list)
+    user2_prefers: list[str] = Field(default_factory=list)
+
+
 class UserComparisonResponse(BaseModel):
     """Comparison between two users."""
     user1: UserInfo
@@ -182,7 +252,7 @@ class UserComparisonResponse(BaseModel):
     shared_favorites: list[SharedVNScore]
     biggest_disagreements: list[SharedVNScore]
     common_tags: list[str]
-    differing_tastes: dict[str, list[str]]
+    differing_tastes: DifferingTastes
     # Enhanced comparison metrics
     tag_similarity: float | None = None  # 0-1 tag preference similarity
     confidence: float | None = None  # 0-1 reliability of comparison
@@ -316,11 +386,11 @@ class VNDetailResponse(BaseModel):
     platforms: list[str]
     developers: list[DeveloperInfo]
     tags: list[VNTagInfo]
-    relations: list[VNRelationInfo] = []
+    relations: list[VNRelationInfo] = Field(default_factory=list)
     olang: str | None = None  # Original language (e.g., "ja" for Japanese)
     updated_at: datetime | None = None
-    links: list[ExtlinkInfo] = []
-    shops: list[ExtlinkInfo] = []
+    links: list[ExtlinkInfo] = Field(default_factory=list)
+    shops: list[ExtlinkInfo] = Field(default_factory=list)
 
 
 class VNMonthlyVotes(BaseModel):
@@ -745,77 +815,11 @@ class TraitCharactersResponse(BaseModel):
     pages: int
 
 
-# ============ User Stats Breakdown Schemas ============
-
-class ProducerBreakdown(BaseModel):
-    """Developer or publisher statistics for a user."""
-    id: str  # e.g., "p1"
-    name: str
-    original: str | None = None  # Romanized/latin name
-    type: str | None  # "co" (company), "in" (individual), "ng" (amateur group)
-    count: int  # Number of VNs from this producer
-    avg_rating: float  # User's average rating for VNs from this producer
-    global_avg_rating: float | None = None  # Global average rating for VNs from this producer
-    weighted_score: float | None = None  # Bayesian-weighted score for ranking
-
-
-class StaffBreakdown(BaseModel):
-    """Staff member statistics for a user."""
-    id: str  # e.g., "s1"
-    name: str
-    original: str | None = None  # Romanized/latin name
-    role: str  # "scenario", "art", "music", "songs", "director"
-    count: int  # Number of VNs this staff worked on
-    avg_rating: float  # User's average rating for VNs this staff worked on
-    global_avg_rating: float | None = None  # Global average rating for VNs this staff worked on
-    weighted_score: float | None = None  # Bayesian-weighted score for ranking
-
-
-class SeiyuuBreakdown(BaseModel):
-    """Voice actor (seiyuu) statistics for a user."""
-    id: str  # Staff ID, e.g., "s1"
-    name: str
-    original: str | None = None  # Romanized/latin name
-    count: int  # Number of VNs this seiyuu voiced in
-    avg_rating: float  # User's average rating for VNs this seiyuu voiced in
-    global_avg_rating: float | None = None  # Global average rating for VNs this seiyuu voiced in
-    weighted_score: float | None = None  # Bayesian-weighted score for ranking
-
-
-class TraitBreakdown(BaseModel):
-    """Character trait statistics for a user."""
-    id: int
-    name: str
-    group_name: str | None  # Trait category (e.g., "Hair", "Eyes", "Personality")
-    count: int  # Number of characters with this trait in user's VNs
-    vn_count: int  # Number of VNs with characters having this trait
-    frequency: float  # Percentage of user's VNs that have this trait (0-100)
-    avg_rating: float | None = None  # User's average rating for VNs with this trait
-    global_avg_rating: float | None = None  # Global average rating for VNs with this trait
-    weighted_score: float | None = None  # Bayesian-weighted score for ranking
-
-
-# Rebuild models to resolve forward references
-UserStatsResponse.model_rebuild()
-
-
 # ============ News Schemas ============
 
-from enum import Enum
-from typing import Any
-
-
-class NewsSource(str, Enum):
-    """Available news sources."""
-    vndb = "vndb"
-    vndb_release = "vndb_release"
-    rss = "rss"
-    twitter = "twitter"
-    announcement = "announcement"
-
-
 class NewsItemResponse(BaseModel):
     """Single news item response."""
+    type: Literal["item"] = "item"
     id: str
     source: str
     sourceLabel: str
@@ -828,13 +832,10 @@ class NewsItemResponse(BaseModel):
     tags: list[str] | None
     extraData: dict[str, Any] | None = None
 
-    class Config:
-        from_attributes = True
-
 
 class NewsDigestItem(BaseModel):
     """A digest card containing multiple news items grouped by date."""
-    type: str = "digest"
+    type: Literal["digest"] = "digest"
     id: str  # e.g., "digest-vndb-2026-01-16"
     source: str
     sourceLabel: str
@@ -847,26 +848,8 @@ class NewsDigestItem(BaseModel):
     previewImages: list[str]  # First 3-4 cover images
 
 
-class NewsListItem(BaseModel):
-    """Union type for news feed items - either individual or digest."""
-    type: str = "item"  # "item" or "digest"
-    # Fields for individual items
-    id: str | None = None
-    source: str | None = None
-    sourceLabel: str | None = None
-    title: str | None = None
-    summary: str | None = None
-    url: str | None = None
-    imageUrl: str | None = None
-    imageIsNsfw: bool = False
-    publishedAt: datetime | None = None
-    tags: list[str] | None = None
-    extraData: dict[str, Any] | None = None
-    # Fields for digest items
-    date: str | None = None
-    count: int | None = None
-    items: list[NewsItemResponse] | None = None
-    previewImages: list[str] | None = None
+# News feed entry - an individual item or a digest card, told apart by `type`
+NewsListItem = Annotated[NewsItemResponse | NewsDigestItem, Field(discriminator="type")]
 
 
 class NewsListResponse(BaseModel):
@@ -935,9 +918,6 @@ class AnnouncementResponse(BaseModel):
     isActive: bool
     createdBy: str | None
 
-    class Config:
-        from_attributes = True
-
 
 class RSSFeedConfigCreate(BaseModel):
     """Create a new RSS feed config."""
@@ -970,9 +950,6 @@ class RSSFeedConfigResponse(BaseModel):
     lastChecked: datetime | None
     checkIntervalMinutes: int
 
-    class Config:
-        from_attributes = True
-
 
 # ============ Tag/Trait Search Schemas ============
 
@@ -1143,7 +1120,7 @@ class BrowseStaffItem(BaseModel):
     gender: str | None = None
     lang: str | None = None
     vn_count: int = 0
-    roles: list[str] = []
+    roles: list[str] = Field(default_factory=list)
     description: str | None = None
 
 class BrowseSeiyuuItem(BaseModel):
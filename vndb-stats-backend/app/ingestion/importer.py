@@ -512,6 +512,9 @@ async def swap_staging_to_live(table_names: str | list[str]) -> bool:
                 # Rewrite CREATE INDEX to target staging table with _new suffix
                 # idx_def format: "CREATE INDEX idx_name ON public.table USING btree (columns)"
                 staging_def = idx_def.replace(f" {idx_name} ", f" {new_idx_name} ")
+                # Partitioned parents (global_votes) report "ON ONLY"; drop it so
+                # the index cascades to every staging partition
+                staging_def = staging_def.replace(f"ON ONLY public.{table} ", f"ON public.{staging} ")
                 staging_def = staging_def.replace(f"ON public.{table} ", f"ON public.{staging} ")
                 staging_def = staging_def.replace(f"ON public.{table}(", f"ON public.{staging}(")
                 try:
@@ -809,6 +812,10 @@ async def import_votes(votes_path: str, force: bool = False):
 
             user_hash = parts[1]
             vote = int(parts[2])
+            # global_votes has a 10-100 CHECK; one bad row would abort the COPY
+            if not 10 <= vote <= 100:
+                skipped += 1
+                continue
             vote_date = parts[3] if len(parts) > 3 else None
 
             # Handle VNDB's null marker
@@ -1687,120 +1694,97 @@ async def update_browse_precomputed_counts():
     """
     logger.info("Computing precomputed browse counts for tags, traits, staff and producers...")
 
+    # Each table is refreshed with one statement: the aggregate is LEFT JOINed
+    # onto every row (so rows that lost all links get 0/NULL without a separate
+    # reset pass) and only rows whose values actually changed are written.
+    # Rewriting every row twice per import left the whole table as dead tuples
+    # and churned the vn_count sort indexes for no change on most rows.
     async with async_session() as db:
         # Tag vn_count — recompute from vn_tags using the same filter as the
         # paginated novels endpoint (score > 0, lie = false) so the badge
         # matches the list total exactly.
-        # Reset first so tags that lost all VNs get 0.
-        await db.execute(text("UPDATE tags SET vn_count = 0"))
         result = await db.execute(text("""
             UPDATE tags SET vn_count = COALESCE(sub.cnt, 0)
-            FROM (
+            FROM tags t
+            LEFT JOIN (
                 SELECT tag_id, COUNT(DISTINCT vn_id) AS cnt
                 FROM vn_tags
                 WHERE score > 0 AND lie = false
                 GROUP BY tag_id
-            ) sub
-            WHERE tags.id = sub.tag_id
+            ) sub ON sub.tag_id = t.id
+            WHERE tags.id = t.id
+              AND tags.vn_count IS DISTINCT FROM COALESCE(sub.cnt, 0)
         """))
         logger.info(f"Updated vn_count for {result.rowcount} tags")
 
         # Trait char_count — recompute from character_traits joined with
         # characters so the badge matches the paginated list total exactly.
         # VNDB dump "chars" count may include characters we didn't import.
-        # Reset first so traits that lost all characters get 0.
-        await db.execute(text("UPDATE traits SET char_count = 0"))
         result = await db.execute(text("""
             UPDATE traits SET char_count = COALESCE(sub.cnt, 0)
-            FROM (
+            FROM traits t
+            LEFT JOIN (
                 SELECT ct.trait_id, COUNT(DISTINCT ct.character_id) AS cnt
                 FROM character_traits ct
                 JOIN characters c ON c.id = ct.character_id
                 GROUP BY ct.trait_id
-            ) sub
-            WHERE traits.id = sub.trait_id
+            ) sub ON sub.trait_id = t.id
+            WHERE traits.id = t.id
+              AND traits.char_count IS DISTINCT FROM COALESCE(sub.cnt, 0)
         """))
         logger.info(f"Updated char_count for {result.rowcount} traits")
 
-        # Reset counts to 0 first (handles staff/producers that lost all credits)
-        await db.execute(text("UPDATE staff SET vn_count = 0, roles = NULL, seiyuu_vn_count = 0, seiyuu_char_count = 0"))
-        await db.execute(text("UPDATE producers SET vn_count = 0, dev_vn_count = 0, pub_vn_count = 0"))
-
-        # Staff vn_count
-        result = await db.execute(text("""
-            UPDATE staff SET vn_count = sub.cnt
-            FROM (
-                SELECT staff_id, COUNT(DISTINCT vn_id) AS cnt
-                FROM vn_staff GROUP BY staff_id
-            ) sub
-            WHERE staff.id = sub.staff_id
-        """))
-        logger.info(f"Updated vn_count for {result.rowcount} staff")
-
-        # Staff roles array
+        # Staff vn_count, roles array and seiyuu counts
         result = await db.execute(text("""
-            UPDATE staff SET roles = sub.role_list
-            FROM (
-                SELECT staff_id, ARRAY_AGG(DISTINCT role ORDER BY role) AS role_list
+            UPDATE staff SET
+                vn_count = COALESCE(credits.cnt, 0),
+                roles = credits.role_list,
+                seiyuu_vn_count = COALESCE(va.vn_cnt, 0),
+                seiyuu_char_count = COALESCE(va.char_cnt, 0)
+            FROM staff s
+            LEFT JOIN (
+                SELECT staff_id,
+                       COUNT(DISTINCT vn_id) AS cnt,
+                       ARRAY_AGG(DISTINCT role ORDER BY role) AS role_list
                 FROM vn_staff GROUP BY staff_id
-            ) sub
-            WHERE staff.id = sub.staff_id
-        """))
-        logger.info(f"Updated roles for {result.rowcount} staff")
-
-        # Staff seiyuu counts
-        result = await db.execute(text("""
-            UPDATE staff SET seiyuu_vn_count = sub.vn_cnt, seiyuu_char_count = sub.char_cnt
-            FROM (
+            ) credits ON credits.staff_id = s.id
+            LEFT JOIN (
                 SELECT staff_id,
                        COUNT(DISTINCT vn_id) AS vn_cnt,
                        COUNT(DISTINCT character_id) AS char_cnt
                 FROM vn_seiyuu GROUP BY staff_id
-            ) sub
-            WHERE staff.id = sub.staff_id
-        """))
-        logger.info(f"Updated seiyuu counts for {result.rowcount} staff")
-
-        # Producer total vn_count
-        result = await db.execute(text("""
-            UPDATE producers SET vn_count = sub.cnt
-            FROM (
-                SELECT rp.producer_id, COUNT(DISTINCT rv.vn_id) AS cnt
-                FROM release_producers rp
-                JOIN release_vn rv ON rp.release_id = rv.release_id
-                GROUP BY rp.producer_id
-            ) sub
-            WHERE producers.id = sub.producer_id
+            ) va ON va.staff_id = s.id
+            WHERE staff.id = s.id
+              AND (staff.vn_count, staff.roles, staff.seiyuu_vn_count, staff.seiyuu_char_count)
+                  IS DISTINCT FROM
+                  (COALESCE(credits.cnt, 0), credits.role_list,
+                   COALESCE(va.vn_cnt, 0), COALESCE(va.char_cnt, 0))
         """))
-        logger.info(f"Updated vn_count for {result.rowcount} producers")
+        logger.info(f"Updated vn_count/roles/seiyuu counts for {result.rowcount} staff")
 
-        # Producer dev_vn_count
+        # Producer total, developer and publisher VN counts in one pass over
+        # release_producers JOIN release_vn (was three separate aggregates)
         result = await db.execute(text("""
-            UPDATE producers SET dev_vn_count = sub.cnt
-            FROM (
-                SELECT rp.producer_id, COUNT(DISTINCT rv.vn_id) AS cnt
+            UPDATE producers SET
+                vn_count = COALESCE(sub.cnt, 0),
+                dev_vn_count = COALESCE(sub.dev_cnt, 0),
+                pub_vn_count = COALESCE(sub.pub_cnt, 0)
+            FROM producers p
+            LEFT JOIN (
+                SELECT rp.producer_id,
+                       COUNT(DISTINCT rv.vn_id) AS cnt,
+                       COUNT(DISTINCT rv.vn_id) FILTER (WHERE rp.developer) AS dev_cnt,
+                       COUNT(DISTINCT rv.vn_id) FILTER (WHERE rp.publisher) AS pub_cnt
                 FROM release_producers rp
                 JOIN release_vn rv ON rp.release_id = rv.release_id
-                WHERE rp.developer = true
                 GROUP BY rp.producer_id
-            ) sub
-            WHERE producers.id = sub.producer_id
-        """))
-        logger.info(f"Updated dev_vn_count for {result.rowcount} producers")
-
-        # Producer pub_vn_count
-        result = await db.execute(text("""
-            UPDATE producers SET pub_vn_count = sub.cnt
-            FROM (
-                SELECT rp.producer_id, COUNT(DISTINCT rv.vn_id) AS cnt
-                FROM release_producers rp
-                JOIN release_vn rv ON rp.release_id = rv.release_id
-                WHERE rp.publisher = true
-                GROUP BY rp.producer_id
-            ) sub
-            WHERE producers.id = sub.producer_id
+            ) sub ON sub.producer_id = p.id
+            WHERE producers.id = p.id
+              AND (producers.vn_count, producers.dev_vn_count, producers.pub_vn_count)
+                  IS DISTINCT FROM
+                  (COALESCE(sub.cnt, 0), COALESCE(sub.dev_cnt, 0), COALESCE(sub.pub_cnt, 0))
         """))
-        logger.info(f"Updated pub_vn_count for {result.rowcount} producers")
+        logger.info(f"Updated vn_count/dev_vn_count/pub_vn_count for {result.rowcount} producers")
 
         await db.commit()
 
@@ -5113,6 +5097,8 @@ async def log_import_message(
     from datetime import datetime, timezone
 
     async with async_session() as db:
+        # One commit per log line during an import; don't wait for WAL fsync
+        await db.execute(text("SET LOCAL synchronous_commit = off"))
         log_entry = ImportLog(
             run_id=run_id,
             timestamp=datetime.now(timezone.utc),
@@ -10,39 +10,34 @@ os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
 
 import numpy as np
 from scipy import sparse
-from sqlalchemy import Column, DateTime, Float, Integer, MetaData, String, Table, select, text
+from sqlalchemy import select, text
 from sqlalchemy.dialects.postgresql import insert
 
 from app.config import get_settings
-from app.db.database import async_session
+from app.db.database import async_session, engine
 from app.db.models import (
     GlobalVote, Tag, VNTag, VisualNovel,
-    CFUserFactors, CFVNFactors, TagVNVector, VNSimilarity, VNCoOccurrence,
+    CFVNFactors, TagVNVector, VNSimilarity, VNCoOccurrence,
 )
 
-# Staging table references for zero-downtime similarity updates.
-# New data is written here, then atomically swapped to live via table renames.
-_staging_meta = MetaData()
+logger = logging.getLogger(__name__)
+settings = get_settings()
 
-_vn_sim_staging = Table(
-    'vn_similarities_staging', _staging_meta,
-    Column('vn_id', String(10), primary_key=True),
-    Column('similar_vn_id', String(10), primary_key=True),
-    Column('similarity_score', Float, nullable=False),
-    Column('computed_at', DateTime, nullable=False),
-)
 
-_vn_cooccur_staging = Table(
-    'vn_cooccurrence_staging', _staging_meta,
-    Column('vn_id', String(10), primary_key=True),
-    Column('similar_vn_id', String(10), primary_key=True),
-    Column('co_rating_score', Float, nullable=False),
-    Column('user_count', Integer, nullable=False),
-    Column('computed_at', DateTime, nullable=False),
-)
+async def _copy_records(db, table: str, columns: tuple[str, ...], batch: list[dict]):
+    """Bulk-load rows with binary COPY on the session's own connection.
 
-logger = logging.getLogger(__name__)
-settings = get_settings()
+    Every caller TRUNCATEs the target earlier in the same transaction, so there
+    are no conflicts to resolve and COPY replaces multi-row INSERT ... VALUES
+    (no SQL text to build or parse, arrays sent in binary, no parameter limit).
+    """
+    conn = await db.connection()
+    raw_conn = await conn.get_raw_connection()
+    await raw_conn.driver_connection.copy_records_to_table(
+        table,
+        records=[tuple(row[c] for c in columns) for row in batch],
+        columns=columns,
+    )
 
 
 def _log_memory(label: str):
@@ -145,16 +140,8 @@ async def compute_tag_vectors():
 
 
 async def _insert_tag_vectors(db, batch: list[dict]):
-    """Insert tag vectors."""
-    stmt = insert(TagVNVector).values(batch)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["vn_id"],
-        set_={
-            "tag_vector": stmt.excluded.tag_vector,
-            "computed_at": stmt.excluded.computed_at,
-        }
-    )
-    await db.execute(stmt)
+    """Insert tag vectors (table truncated first by compute_tag_vectors)."""
+    await _copy_records(db, "tag_vn_vectors", ("vn_id", "tag_vector", "computed_at"), batch)
 
 
 async def train_collaborative_filter():
@@ -172,8 +159,10 @@ async def train_collaborative_filter():
         return
 
     async with async_session() as db:
-        # Load votes into memory
+        # Load votes into memory. global_votes is hash-partitioned, so let the
+        # planner scan partitions in parallel for this full-table read.
         logger.info("Loading votes...")
+        await db.execute(text("SET LOCAL max_parallel_workers_per_gather = 8"))
         result = await db.execute(
             select(GlobalVote.user_hash, GlobalVote.vn_id, GlobalVote.vote)
         )
@@ -276,29 +265,13 @@ async def train_collaborative_filter():
 
 
 async def _insert_user_factors(db, batch: list[dict]):
-    """Insert user factors."""
-    stmt = insert(CFUserFactors).values(batch)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["user_hash"],
-        set_={
-            "factors": stmt.excluded.factors,
-            "computed_at": stmt.excluded.computed_at,
-        }
-    )
-    await db.execute(stmt)
+    """Insert user factors (table truncated first by train_collaborative_filter)."""
+    await _copy_records(db, "cf_user_factors", ("user_hash", "factors", "computed_at"), batch)
 
 
 async def _insert_vn_factors(db, batch: list[dict]):
-    """Insert VN factors."""
-    stmt = insert(CFVNFactors).values(batch)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["vn_id"],
-        set_={
-            "factors": stmt.excluded.factors,
-            "computed_at": stmt.excluded.computed_at,
-        }
-    )
-    await db.execute(stmt)
+    """Insert VN factors (table truncated first by train_collaborative_filter)."""
+    await _copy_records(db, "cf_vn_factors", ("vn_id", "factors", "computed_at"), batch)
 
 
 async def compute_vn_similarities(top_k: int = 100):
@@ -373,36 +346,43 @@ async def compute_vn_similarities(top_k: int = 100):
         # Step 3: Compute similarities in batches
         batch_size = 500
         total_inserted = 0
+        k = min(top_k, num_vns - 1)
 
         for batch_start in range(0, num_vns, batch_size):
             batch_end = min(batch_start + batch_size, num_vns)
             batch_vn_ids = vn_ids[batch_start:batch_end]
             batch_vectors = vectors_matrix[batch_start:batch_end]
 
-            # Compute cosine similarity against all VNs
+            # Compute cosine similarity against all VNs (one float32 SGEMM).
             # Since vectors are normalized, dot product = cosine similarity
             similarities = batch_vectors @ vectors_matrix.T
 
-            similarity_records = []
+            # Top-K for the whole batch at once (excluding self), instead of an
+            # argpartition/argsort per VN in Python
+            rows = np.arange(batch_end - batch_start)
+            similarities[rows, batch_start + rows] = -1
+            top_indices = np.argpartition(similarities, -k, axis=1)[:, -k:]
+            top_sims = np.take_along_axis(similarities, top_indices, axis=1)
+            order = np.argsort(-top_sims, axis=1, kind="stable")
+            top_indices = np.take_along_axis(top_indices, order, axis=1)
+            top_sims = np.take_along_axis(top_sims, order, axis=1)
+
+            # Only store meaningful similarities
+            keep_rows, keep_cols = np.nonzero(top_sims > 0.1)
             now = datetime.utcnow()
-
-            for local_idx, vn_id in enumerate(batch_vn_ids):
-                global_idx = batch_start + local_idx
-                sims = similarities[local_idx]
-
-                # Get top-K (excluding self)
-                sims[global_idx] = -1
-                top_indices = np.argpartition(sims, -top_k)[-top_k:]
-                top_indices = top_indices[np.argsort(sims[top_indices])[::-1]]
-
-                for sim_idx in top_indices:
-                    if sims[sim_idx] > 0.1:  # Only store meaningful similarities
-                        similarity_records.append({
-                            "vn_id": vn_id,
-                            "similar_vn_id": vn_ids[sim_idx],
-                            "similarity_score": float(sims[sim_idx]),
-                            "computed_at": now,
-                        })
+            similarity_records = [
+                {
+                    "vn_id": batch_vn_ids[r],
+                    "similar_vn_id": vn_ids[sim_idx],
+                    "similarity_score": score,
+                    "computed_at": now,
+                }
+                for r, sim_idx, score in zip(
+                    keep_rows.tolist(),
+                    top_indices[keep_rows, keep_cols].tolist(),
+                    top_sims[keep_rows, keep_cols].tolist(),
+                )
+            ]
 
             if similarity_records:
                 await _insert_vn_similarities_staging(db, similarity_records)
@@ -577,16 +557,19 @@ async def compute_item_item_similarity(top_k: int = 50, min_users: int = 20):
 
 
 async def _insert_vn_similarities_staging(db, batch: list[dict]):
-    """Insert VN similarities into staging table (plain INSERT, no conflict handling)."""
-    chunk_size = 5000
-    for i in range(0, len(batch), chunk_size):
-        chunk = batch[i:i + chunk_size]
-        await db.execute(_vn_sim_staging.insert().values(chunk))
+    """Insert VN similarities into staging table (binary COPY, no conflict handling)."""
+    await _copy_records(
+        db, "vn_similarities_staging",
+        ("vn_id", "similar_vn_id", "similarity_score", "computed_at"), batch,
+    )
 
 
 async def _insert_vn_cooccurrence_staging(db, batch: list[dict]):
-    """Insert VN co-occurrence records into staging table."""
-    await db.execute(_vn_cooccur_staging.insert().values(batch))
+    """Insert VN co-occurrence records into staging table (binary COPY)."""
+    await _copy_records(
+        db, "vn_cooccurrence_staging",
+        ("vn_id", "similar_vn_id", "co_rating_score", "user_count", "computed_at"), batch,
+    )
 
 
 async def swap_similarity_tables():
@@ -627,11 +610,12 @@ async def swap_similarity_tables():
         await db.execute(text(
             "CREATE INDEX idx_vn_sim_score_new ON vn_similarities_staging (vn_id, similarity_score DESC)"
         ))
+        # Covering index for the "users also read" lookups (vn_id = X ORDER BY
+        # score DESC): INCLUDE lets them run as index-only scans. It also serves
+        # plain vn_id lookups, so there is no separate idx_vn_cooccur_vn.
         await db.execute(text(
-            "CREATE INDEX idx_vn_cooccur_vn_new ON vn_cooccurrence_staging (vn_id)"
-        ))
-        await db.execute(text(
-            "CREATE INDEX idx_vn_cooccur_score_new ON vn_cooccurrence_staging (vn_id, co_rating_score DESC)"
+            "CREATE INDEX idx_vn_cooccur_score_new ON vn_cooccurrence_staging "
+            "(vn_id, co_rating_score DESC) INCLUDE (similar_vn_id, user_count)"
         ))
         await db.commit()
 
@@ -655,7 +639,6 @@ async def swap_similarity_tables():
         try:
             logger.info("Running ANALYZE on new live tables...")
             await db.execute(text("ANALYZE vn_similarities"))
-            await db.execute(text("ANALYZE vn_cooccurrence"))
             await db.execute(text("TRUNCATE TABLE vn_similarities_staging"))
             await db.execute(text("TRUNCATE TABLE vn_cooccurrence_staging"))
 
@@ -682,7 +665,6 @@ async def swap_similarity_tables():
             # Rename new indexes to canonical names (for next cycle)
             await db.execute(text("ALTER INDEX idx_vn_sim_vn_new RENAME TO idx_vn_sim_vn"))
             await db.execute(text("ALTER INDEX idx_vn_sim_score_new RENAME TO idx_vn_sim_score"))
-            await db.execute(text("ALTER INDEX idx_vn_cooccur_vn_new RENAME TO idx_vn_cooccur_vn"))
             await db.execute(text("ALTER INDEX idx_vn_cooccur_score_new RENAME TO idx_vn_cooccur_score"))
             await db.commit()
             logger.info("Staging tables cleaned up for next run")
@@ -690,6 +672,17 @@ async def swap_similarity_tables():
             logger.warning(f"Post-swap cleanup failed (live data is serving correctly): {e}")
             await db.rollback()
 
+    # VACUUM (not just ANALYZE) the new vn_cooccurrence: a freshly loaded table
+    # has no visibility map, so index-only scans on the covering index would
+    # still visit the heap for every row until autovacuum got to it.
+    # VACUUM can't run inside a transaction block, hence the autocommit connection.
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("VACUUM (ANALYZE) vn_cooccurrence"))
+    except Exception as e:
+        logger.warning(f"VACUUM of vn_cooccurrence failed (falling back to autovacuum): {e}")
+
 
 async def train_hybrid_embeddings(n_components: int = 64, epochs: int = 30):
     """
@@ -1,19 +1,84 @@
 """Log cleanup utilities."""
 
 import logging
+import re
 from datetime import datetime, timezone, timedelta
 
-from sqlalchemy import delete
+from sqlalchemy import delete, text
 
 from app.db.database import async_session
-from app.db.models import AppLog
+from app.db.models import AppLog, APP_LOGS_PARTITION_DAYS_AHEAD, app_logs_partition_ddl
 
 logger = logging.getLogger(__name__)
 
+_PARTITION_NAME_RE = re.compile(r"^app_logs_p(\d{8})$")
+
+
+async def ensure_log_partitions(db, days_ahead: int = APP_LOGS_PARTITION_DAYS_AHEAD) -> None:
+    """Create the daily app_logs partitions for today and the next few days."""
+    today = datetime.now(timezone.utc).date()
+    for offset in range(days_ahead + 1):
+        try:
+            # Savepoint: a failure (e.g. rows for that day already sitting in
+            # app_logs_default) must not abort the rest of the cleanup
+            async with db.begin_nested():
+                await db.execute(text(app_logs_partition_ddl(today + timedelta(days=offset))))
+        except Exception as e:
+            logger.warning(f"Could not create app_logs partition for +{offset}d: {e}")
+
+
+async def _drop_expired_partitions(db, cutoff: datetime) -> int:
+    """Drop daily partitions that end at or before the cutoff. Returns the count."""
+    result = await db.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'app_logs'::regclass"
+    ))
+    dropped = 0
+    for (name,) in result.all():
+        match = _PARTITION_NAME_RE.match(name)
+        if not match:
+            continue
+        day = datetime.strptime(match.group(1), "%Y%m%d").date()
+        if day + timedelta(days=1) <= cutoff.date():
+            # Name comes from the catalog and matched the strict pattern above
+            await db.execute(text(f"DROP TABLE {name}"))
+            dropped += 1
+    return dropped
+
+
+async def purge_old_logs(db, cutoff: datetime) -> tuple[int, int]:
+    """
+    Remove logs older than the cutoff and make sure upcoming partitions exist.
+
+    Whole expired daily partitions are dropped (no row-by-row DELETE or vacuum
+    debt); the remaining rows older than the cutoff (the partially expired day
+    and anything in the default partition) are deleted. The caller commits.
+
+    Returns:
+        (dropped partitions, deleted rows)
+    """
+    dropped = await _drop_expired_partitions(db, cutoff)
+    result = await db.execute(
+        delete(AppLog).where(AppLog.timestamp < cutoff)
+    )
+    await ensure_log_partitions(db)
+    return dropped, result.rowcount
+
+
+async def create_log_partitions() -> None:
+    """Create the upcoming daily app_logs partitions (scheduled in every mode)."""
+    try:
+        async with async_session() as db:
+            await ensure_log_partitions(db)
+            await db.commit()
+    except Exception as e:
+        logger.error(f"app_logs partition creation failed: {e}")
+
 
 async def cleanup_old_logs(retention_days: int = 30):
     """
-    Delete logs older than retention period.
+    Delete logs older than retention period (see purge_old_logs()).
 
     Args:
         retention_days: Number of days to retain logs (default 30)
@@ -22,14 +87,14 @@ async def cleanup_old_logs(retention_days: int = 30):
 
     try:
         async with async_session() as db:
-            result = await db.execute(
-                delete(AppLog).where(AppLog.timestamp < cutoff)
-            )
+            dropped, deleted_count = await purge_old_logs(db, cutoff)
             await db.commit()
 
-            deleted_count = result.rowcount
-            if deleted_count > 0:
-                logger.info(f"Log cleanup: deleted {deleted_count} entries older than {retention_days} days")
+            if dropped or deleted_count > 0:
+                logger.info(
+                    f"Log cleanup: dropped {dropped} daily partitions and deleted "
+                    f"{deleted_count} entries older than {retention_days} days"
+                )
             else:
                 logger.debug(f"Log cleanup: no entries older than {retention_days} days")
 
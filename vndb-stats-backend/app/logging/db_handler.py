@@ -6,7 +6,7 @@ import logging
 import sys
 import threading
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from queue import Queue, Empty
 from typing import Optional
@@ -38,6 +38,91 @@ SKIP_LOGGERS = frozenset([
 ])
 
 
+# Repeats of an error_hash within this window are merged into one row
+DEDUP_WINDOW = timedelta(hours=1)
+
+# Merge folded error reports into the newest row with the same hash inside the
+# dedup window (served by idx_app_logs_hash_timestamp). Returns the hashes that
+# were merged; the rest become new rows.
+_DEDUP_UPDATE_SQL = """
+    WITH batch AS (
+        SELECT * FROM unnest(
+            CAST(:hashes AS bytea[]), CAST(:counts AS int[]),
+            CAST(:last_seen AS timestamptz[])
+        ) AS b(error_hash, n, last_seen)
+    ),
+    target AS (
+        SELECT DISTINCT ON (a.error_hash) a.id, a.timestamp, b.n, b.last_seen
+        FROM app_logs a
+        JOIN batch b ON b.error_hash = a.error_hash
+        WHERE a.timestamp >= :cutoff
+        ORDER BY a.error_hash, a.timestamp DESC
+    )
+    UPDATE app_logs a
+    SET occurrence_count = COALESCE(a.occurrence_count, 1) + t.n,
+        last_seen = GREATEST(a.last_seen, t.last_seen)
+    FROM target t
+    WHERE a.id = t.id AND a.timestamp = t.timestamp
+    RETURNING a.error_hash
+"""
+
+
+def _app_log_row(entry: dict) -> dict:
+    """Map a queued entry onto app_logs columns (same keys for every row)."""
+    return {
+        "timestamp": entry["timestamp"],
+        "level": entry["level"],
+        "source": entry["source"],
+        "module": entry.get("module"),
+        "message": entry["message"][:5000] if entry["message"] else "",
+        "url": entry.get("url"),
+        "user_agent": entry.get("user_agent"),
+        "stack_trace": entry.get("stack_trace"),
+        "error_hash": entry.get("error_hash"),
+        "occurrence_count": entry.get("occurrence_count", 1),
+        "first_seen": entry.get("first_seen"),
+        "last_seen": entry.get("last_seen"),
+        "extra_data": entry.get("extra_data"),
+        "correlation_id": entry.get("correlation_id"),
+    }
+
+
+def _fold_into(grouped: dict[bytes, dict], entry: dict) -> None:
+    """Fold one error report into grouped, keyed by its error_hash.
+
+    Entries may already be folded (a requeued retry, which can arrive after
+    newer reports), so counts are added up and first/last seen take the
+    earliest/latest rather than arrival order.
+    """
+    count = entry.get("occurrence_count", 1)
+    first_seen = entry.get("first_seen") or entry["timestamp"]
+    last_seen = entry.get("last_seen") or entry["timestamp"]
+    group = grouped.get(entry["error_hash"])
+    if group is None:
+        grouped[entry["error_hash"]] = {
+            **entry,
+            "occurrence_count": count,
+            "first_seen": first_seen,
+            "last_seen": last_seen,
+        }
+    else:
+        group["occurrence_count"] += count
+        group["first_seen"] = min(group["first_seen"], first_seen)
+        group["last_seen"] = max(group["last_seen"], last_seen)
+
+
+def _fold_by_error_hash(entries: list[dict]) -> dict[bytes, dict]:
+    """Collapse entries sharing an error_hash into one, keeping the first.
+
+    The kept entry's occurrence_count becomes the number of repeats and its
+    first_seen/last_seen the earliest/latest timestamps among them.
+    """
+    grouped: dict[bytes, dict] = {}
+    for entry in entries:
+        _fold_into(grouped, entry)
+    return grouped
+
+
 class AsyncDBLogHandler(logging.Handler):
     """
     Asynchronous logging handler that writes to PostgreSQL.
@@ -167,6 +252,17 @@ class AsyncDBLogHandler(logging.Handler):
                 )
             self._worker_thread = None
 
+    def submit(self, entry: dict):
+        """Queue a prebuilt app_logs row (e.g. a frontend error report).
+
+        Entries carrying an error_hash are deduplicated before they reach the
+        database: repeats are folded together in memory until the next flush,
+        then merged into the newest row with the same hash from the last hour,
+        if there is one.
+        """
+        entry.setdefault("_retry_count", 0)
+        self._queue.put(entry)
+
     def emit(self, record: logging.LogRecord):
         """Handle a log record - queue it for async writing."""
         # Check level
@@ -217,39 +313,49 @@ class AsyncDBLogHandler(logging.Handler):
         self._loop = loop
 
         batch = []
+        # Error reports are folded by hash as they arrive, so a storm of one
+        # frontend error becomes a single row update per flush instead of
+        # filling batches (and flushing) every batch_size reports
+        errors: dict[bytes, dict] = {}
         last_flush = datetime.now(timezone.utc)
 
+        def take(item: dict):
+            if item.get("error_hash"):
+                _fold_into(errors, item)
+            else:
+                batch.append(item)
+
         while self._running or not self._queue.empty() or not self._retry_queue.empty():
             # First, try to get from retry queue (higher priority for retries)
             try:
-                item = self._retry_queue.get_nowait()
-                batch.append(item)
+                take(self._retry_queue.get_nowait())
             except Empty:
                 pass
 
             # Then from main queue
             try:
-                item = self._queue.get(timeout=1.0)
-                batch.append(item)
+                take(self._queue.get(timeout=1.0))
             except Empty:
                 pass
 
             # Check if we should flush
             now = datetime.now(timezone.utc)
+            pending = len(batch) + len(errors)
             should_flush = (
-                len(batch) >= self.batch_size
-                or (batch and (now - last_flush).total_seconds() >= self.flush_interval)
+                pending >= self.batch_size
+                or (pending and (now - last_flush).total_seconds() >= self.flush_interval)
             )
 
-            if should_flush and batch:
+            if should_flush:
                 # Flush batch to database
-                loop.run_until_complete(self._flush_batch(batch))
+                loop.run_until_complete(self._flush_batch(batch + list(errors.values())))
                 batch = []
+                errors.clear()
                 last_flush = now
 
         # Flush remaining items on shutdown
-        if batch:
-            loop.run_until_complete(self._flush_batch(batch))
+        if batch or errors:
+            loop.run_until_complete(self._flush_batch(batch + list(errors.values())))
 
         # Clean up the local engine
         if self._local_engine:
@@ -284,6 +390,7 @@ class AsyncDBLogHandler(logging.Handler):
             # Import here to avoid circular imports
             from app.config import get_settings
             from app.db.models import AppLog
+            from sqlalchemy import insert, text
             from sqlalchemy.ext.asyncio import (
                 AsyncSession,
                 async_sessionmaker,
@@ -299,7 +406,20 @@ class AsyncDBLogHandler(logging.Handler):
                     pool_size=2,  # Small pool just for logging
                     max_overflow=2,
                     echo=False,
-                    pool_pre_ping=True,
+                    pool_pre_ping=False,
+                    pool_recycle=300,
+                    connect_args={
+                        "server_settings": {
+                            "application_name": "vndb-stats-logs",
+                            # Flushes are tiny INSERT/UPDATEs where JIT
+                            # compilation would cost more than the query
+                            "jit": "off",
+                            # Logs can afford to lose the last few hundred ms
+                            # on a server crash, so don't make every flush
+                            # wait for the WAL fsync
+                            "synchronous_commit": "off",
+                        },
+                    },
                 )
                 self._local_session = async_sessionmaker(
                     self._local_engine,
@@ -307,19 +427,33 @@ class AsyncDBLogHandler(logging.Handler):
                     expire_on_commit=False,
                 )
 
+            rows = [_app_log_row(entry) for entry in batch if not entry.get("error_hash")]
+            grouped = _fold_by_error_hash(
+                [entry for entry in batch if entry.get("error_hash")]
+            )
+
             async with self._local_session() as db:
-                for entry in batch:
-                    log = AppLog(
-                        timestamp=entry["timestamp"],
-                        level=entry["level"],
-                        source=entry["source"],
-                        module=entry["module"],
-                        message=entry["message"][:5000] if entry["message"] else "",
-                        extra_data=entry.get("extra_data"),
-                        correlation_id=entry.get("correlation_id"),
+                if grouped:
+                    # Bump the newest same-hash row from the last hour (one
+                    # statement for the whole batch); hashes without one get
+                    # inserted below as new rows
+                    result = await db.execute(
+                        text(_DEDUP_UPDATE_SQL),
+                        {
+                            "hashes": list(grouped),
+                            "counts": [g["occurrence_count"] for g in grouped.values()],
+                            "last_seen": [g["last_seen"] for g in grouped.values()],
+                            "cutoff": datetime.now(timezone.utc) - DEDUP_WINDOW,
+                        },
+                    )
+                    merged = {row[0] for row in result}
+                    rows.extend(
+                        _app_log_row(g) for h, g in grouped.items() if h not in merged
                     )
-                    db.add(log)
 
+                if rows:
+                    # One multi-row Core INSERT instead of building ORM objects
+                    await db.execute(insert(AppLog), rows)
                 await db.commit()
 
             # Success - reset failure counter and close circuit
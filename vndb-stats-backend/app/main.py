@@ -34,6 +34,7 @@ from app.config import get_settings
 from app.api.v1.router import api_router
 from app.db.database import init_db, get_db
 from app.db.models import VisualNovel, SystemMetadata
+from app.core.cache import get_cache
 from app.core.tasks import TaskManager
 
 logger = logging.getLogger(__name__)
@@ -53,6 +54,7 @@ async def lifespan(app: FastAPI):
 
     # Startup
     await init_db()
+    await get_cache().init()
 
     # Initialize database logging handler
     db_log_handler = AsyncDBLogHandler(
@@ -63,6 +65,8 @@ async def lifespan(app: FastAPI):
     db_log_handler.setFormatter(logging.Formatter("%(message)s"))
     db_log_handler.start()
     logging.getLogger().addHandler(db_log_handler)
+    # Frontend error reports are queued onto the same batched writer
+    app.state.db_log_handler = db_log_handler
     logger.info("Database logging handler initialized")
 
     # Initialize Discord webhook logging (optional)
@@ -89,6 +93,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
     await task_manager.cancel_all(timeout=10.0)
+    await get_cache().close()
     if discord_log_handler:
         discord_log_handler.stop()
     db_log_handler.stop()
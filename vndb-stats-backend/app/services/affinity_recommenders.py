@@ -7,6 +7,7 @@ to find VNs that match user's favorite tags, traits, staff, seiyuu, and producer
 
 import logging
 import math
+from datetime import datetime
 from typing import Optional
 
 import numpy as np
@@ -25,6 +26,94 @@ from app.services.preference_extractor import UserPreferences, PreferenceExtract
 logger = logging.getLogger(__name__)
 
 
+class _EmbeddingSet:
+    """All VN embeddings of one model version, shared across requests."""
+
+    __slots__ = ("version", "vectors", "ids", "index", "matrix")
+
+    def __init__(
+        self, version: tuple[int, datetime | None], ids: list[str], raw: np.ndarray
+    ):
+        # (row count, max(computed_at)) of the rows this set was read from
+        self.version = version
+        self.ids = ids
+        self.index = {vn_id: i for i, vn_id in enumerate(ids)}
+        # Raw float32 rows (views into `raw`) for building user profiles
+        self.vectors = {vn_id: raw[i] for i, vn_id in enumerate(ids)}
+        # Row-normalized copy for batch cosine scoring. Zero vectors stay
+        # zero, so they score 0 against any profile.
+        norms = np.linalg.norm(raw, axis=1, keepdims=True)
+        self.matrix = np.divide(raw, norms, out=np.zeros_like(raw), where=norms > 0)
+
+
+# model_version -> embeddings, reused until the trainer writes a newer set or
+# rows are deleted
+_embedding_sets: dict[str, _EmbeddingSet] = {}
+
+
+async def _load_embedding_set(db: AsyncSession, model_version: str) -> _EmbeddingSet:
+    """Get the VN embeddings for a model version, reading them only when stale.
+
+    Recommenders are built per request, and every load used to pull the whole
+    float8[] embedding table out of Postgres and decode it into Python floats.
+    A (count(*), max(computed_at)) probe is enough to tell whether the cached
+    float32 matrix (half the size of the float8 arrays) is still current: the
+    trainer bumps computed_at, and the importer's ghost-VN cleanup deletes
+    rows without touching it, which changes the count.
+    """
+    count, latest = (await db.execute(
+        select(func.count(), func.max(VNGraphEmbedding.computed_at))
+        .where(VNGraphEmbedding.model_version == model_version)
+    )).one()
+    version = (count, latest)
+
+    cached = _embedding_sets.get(model_version)
+    if cached is not None and cached.version == version:
+        return cached
+
+    result = await db.execute(
+        select(VNGraphEmbedding.vn_id, VNGraphEmbedding.embedding)
+        .where(VNGraphEmbedding.model_version == model_version)
+    )
+    rows = result.all()
+    ids = [row[0] for row in rows]
+    raw = (
+        np.asarray([row[1] for row in rows], dtype=np.float32)
+        if rows else np.empty((0, 0), dtype=np.float32)
+    )
+    embedding_set = _EmbeddingSet(version, ids, raw)
+    _embedding_sets[model_version] = embedding_set
+    logger.info(f"Loaded {len(ids)} VN embeddings for {model_version}")
+    return embedding_set
+
+
+def _top_cosine(
+    ids: list[str],
+    index: dict[str, int],
+    matrix: np.ndarray,
+    profile: np.ndarray,
+    exclude_vns: set[str],
+    threshold: float,
+    k: int,
+) -> list[tuple[str, float]]:
+    """Top-k rows of `matrix` by cosine similarity to a unit `profile`.
+
+    One matrix-vector product (BLAS, SIMD) scores every VN at once instead of
+    a per-VN norm + dot in Python; only rows above `threshold` are kept.
+    """
+    sims = matrix @ profile.astype(np.float32)
+    keep = sims > threshold
+    for vn_id in exclude_vns:
+        row = index.get(vn_id)
+        if row is not None:
+            keep[row] = False
+    rows = np.flatnonzero(keep)
+    if len(rows) > k:
+        rows = rows[np.argpartition(sims[rows], -k)[-k:]]
+    rows = rows[np.argsort(-sims[rows], kind="stable")]
+    return [(ids[r], float(sims[r])) for r in rows]
+
+
 class TagAffinityRecommender:
     """
     Recommends VNs based on user's tag affinities from preference extraction.
@@ -1011,7 +1100,12 @@ class HGATRecommender:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        # Filled from the shared _EmbeddingSet: raw vectors for user profiles,
+        # plus the row-normalized float32 matrix used for batch scoring
         self._vn_embeddings: dict[str, np.ndarray] = {}
+        self._vn_ids: list[str] = []
+        self._vn_index: dict[str, int] = {}
+        self._vn_matrix: np.ndarray | None = None
         self._embeddings_loaded = False
 
     async def _load_vn_embeddings(self):
@@ -1019,16 +1113,12 @@ class HGATRecommender:
         if self._embeddings_loaded:
             return
 
-        result = await self.db.execute(
-            select(VNGraphEmbedding.vn_id, VNGraphEmbedding.embedding)
-            .where(VNGraphEmbedding.model_version == "hgat_v1")
-        )
-
-        for row in result.all():
-            self._vn_embeddings[row[0]] = np.array(row[1])
-
+        embeddings = await _load_embedding_set(self.db, "hgat_v1")
+        self._vn_embeddings = embeddings.vectors
+        self._vn_ids = embeddings.ids
+        self._vn_index = embeddings.index
+        self._vn_matrix = embeddings.matrix
         self._embeddings_loaded = True
-        logger.info(f"Loaded {len(self._vn_embeddings)} VN HGAT embeddings")
 
     async def recommend(
         self,
@@ -1071,25 +1161,11 @@ class HGATRecommender:
         if user_norm > 0:
             user_profile /= user_norm
 
-        # Compute similarity to all VNs
-        candidates = []
-        for vn_id, vn_embedding in self._vn_embeddings.items():
-            if vn_id in exclude_vns:
-                continue
-
-            # Cosine similarity (embeddings should already be normalized)
-            vn_norm = np.linalg.norm(vn_embedding)
-            if vn_norm > 0:
-                sim = float(np.dot(user_profile, vn_embedding / vn_norm))
-            else:
-                sim = 0
-
-            if sim > 0.3:  # Threshold for meaningful similarity
-                candidates.append((vn_id, sim))
-
-        # Sort by similarity
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        candidates = candidates[:limit * 2]
+        # Cosine similarity to all VNs, best first (0.3 = meaningful threshold)
+        candidates = _top_cosine(
+            self._vn_ids, self._vn_index, self._vn_matrix,
+            user_profile, exclude_vns, threshold=0.3, k=limit * 2,
+        )
 
         if not candidates:
             return []
@@ -1448,7 +1524,12 @@ class HybridCFRecommender:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        # Filled from the shared _EmbeddingSet: raw vectors for user profiles,
+        # plus the row-normalized float32 matrix used for batch scoring
         self._vn_embeddings: dict[str, np.ndarray] = {}
+        self._vn_ids: list[str] = []
+        self._vn_index: dict[str, int] = {}
+        self._vn_matrix: np.ndarray | None = None
         self._embeddings_loaded = False
 
     async def _load_vn_embeddings(self):
@@ -1456,16 +1537,12 @@ class HybridCFRecommender:
         if self._embeddings_loaded:
             return
 
-        result = await self.db.execute(
-            select(VNGraphEmbedding.vn_id, VNGraphEmbedding.embedding)
-            .where(VNGraphEmbedding.model_version == "hybrid_v1")
-        )
-
-        for row in result.all():
-            self._vn_embeddings[row[0]] = np.array(row[1])
-
+        embeddings = await _load_embedding_set(self.db, "hybrid_v1")
+        self._vn_embeddings = embeddings.vectors
+        self._vn_ids = embeddings.ids
+        self._vn_index = embeddings.index
+        self._vn_matrix = embeddings.matrix
         self._embeddings_loaded = True
-        logger.info(f"Loaded {len(self._vn_embeddings)} hybrid CF embeddings")
 
     async def recommend(
         self,
@@ -1520,25 +1597,11 @@ class HybridCFRecommender:
         if user_norm > 0:
             user_profile /= user_norm
 
-        # Compute similarity to all VNs
-        candidates = []
-        for vn_id, vn_embedding in self._vn_embeddings.items():
-            if vn_id in exclude_vns:
-                continue
-
-            # Cosine similarity (embeddings are normalized)
-            vn_norm = np.linalg.norm(vn_embedding)
-            if vn_norm > 0:
-                sim = float(np.dot(user_profile, vn_embedding / vn_norm))
-            else:
-                sim = 0
-
-            if sim > 0.3:  # Threshold for meaningful similarity
-                candidates.append((vn_id, sim))
-
-        # Sort by similarity
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        candidates = candidates[:limit * 2]
+        # Cosine similarity to all VNs, best first (0.3 = meaningful threshold)
+        candidates = _top_cosine(
+            self._vn_ids, self._vn_index, self._vn_matrix,
+            user_profile, exclude_vns, threshold=0.3, k=limit * 2,
+        )
 
         if not candidates:
             return []
@@ -120,9 +120,9 @@ class PreferenceExtractor:
         # Get loved/avoided tags for explanations
         loved_tags = []
         avoided_tags = []
-        if tag_analytics and tag_analytics.tag_preferences:
-            loved_list = tag_analytics.tag_preferences.get("loved", [])
-            avoided_list = tag_analytics.tag_preferences.get("avoided", [])
+        if tag_analytics:
+            loved_list = tag_analytics.tag_preferences.loved
+            avoided_list = tag_analytics.tag_preferences.avoided
             loved_tags = [
                 {"id": t.tag_id, "name": t.name, "diff": round(t.user_avg - (t.global_avg or 0), 2)}
                 for t in loved_list[:20]
@@ -221,10 +221,10 @@ class PreferenceExtractor:
         """
         affinities = {}
 
-        if not tag_analytics or not tag_analytics.tag_preferences:
+        if not tag_analytics:
             return affinities
 
-        avoided_list = tag_analytics.tag_preferences.get("avoided", [])
+        avoided_list = tag_analytics.tag_preferences.avoided
         for tag in avoided_list:
             # Calculate penalty weight based on how much user dislikes this tag
             # diff = user_avg - global_avg (negative means user rates lower)
@@ -182,13 +182,15 @@ class TagBasedRecommender:
         result = await self.db.execute(query.limit(2000))
         candidates = result.all()
 
-        # Calculate similarities in batch
-        similarities = []
-        for vn_id, tag_vector in candidates:
-            vn_vector = np.array(tag_vector)
-            sim = float(np.dot(user_profile, vn_vector))
-            if sim > 0:
-                similarities.append((vn_id, sim))
+        if not candidates:
+            return []
+
+        # Calculate similarities in batch: one matrix-vector product
+        vectors = np.asarray([tag_vector for _, tag_vector in candidates], dtype=np.float32)
+        sims = vectors @ np.asarray(user_profile, dtype=np.float32)
+        similarities = [
+            (candidates[i][0], float(sims[i])) for i in np.flatnonzero(sims > 0)
+        ]
 
         # Sort and return top N
         similarities.sort(key=lambda x: x[1], reverse=True)
@@ -253,11 +255,13 @@ class CollaborativeRecommender:
         )
         all_vn_factors = result.all()
 
-        # Calculate scores
-        scores = []
-        for vn_id, vn_factors in all_vn_factors:
-            score = float(np.dot(user_factors, np.array(vn_factors)))
-            scores.append((vn_id, score))
+        if not all_vn_factors:
+            return []
+
+        # Calculate scores: one matrix-vector product over all candidates
+        factors = np.asarray([f for _, f in all_vn_factors], dtype=np.float32)
+        raw_scores = factors @ np.asarray(user_factors, dtype=np.float32)
+        scores = [(row[0], float(score)) for row, score in zip(all_vn_factors, raw_scores)]
 
         scores.sort(key=lambda x: x[1], reverse=True)
         return [{"vn_id": v, "cf_score": s} for v, s in scores[:limit]]
@@ -50,6 +50,11 @@ from app.db.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# The _calculate_*_breakdown methods build one item per entity on the user's
+# list (thousands for large lists) with model_construct(): every field is a
+# float, int or str computed right there, so validation would only re-check
+# values that already have the right type.
+
 # Maximum number of items to return in breakdown sections
 # Prevents memory issues and slow responses for users with large libraries
 MAX_BREAKDOWN_RESULTS = 99999
@@ -1092,7 +1097,7 @@ class StatsService:
                     count=count,
                 )
 
-            breakdown.append(ProducerBreakdown(
+            breakdown.append(ProducerBreakdown.model_construct(
                 id=producer_id,
                 name=data["name"],
                 original=data["original"],
@@ -1183,7 +1188,7 @@ class StatsService:
                     count=count,
                 )
 
-            breakdown.append(ProducerBreakdown(
+            breakdown.append(ProducerBreakdown.model_construct(
                 id=producer_id,
                 name=data["name"],
                 original=data["original"],
@@ -1292,7 +1297,7 @@ class StatsService:
             # Get global average for this staff member (for taste analysis comparison)
             staff_global_avg = per_staff_globals.get(staff_id, overall_global_avg)
 
-            breakdown.append(StaffBreakdown(
+            breakdown.append(StaffBreakdown.model_construct(
                 id=staff_id,
                 name=data["name"],
                 original=data["original"],
@@ -1370,7 +1375,7 @@ class StatsService:
                     count=count,
                 )
 
-            breakdown.append(SeiyuuBreakdown(
+            breakdown.append(SeiyuuBreakdown.model_construct(
                 id=staff_id,
                 name=data["name"],
                 original=data["original"],
@@ -1477,7 +1482,7 @@ class StatsService:
                     count=vn_count,
                 )
 
-            breakdown.append(TraitBreakdown(
+            breakdown.append(TraitBreakdown.model_construct(
                 id=trait_id,
                 name=data["name"],
                 group_name=data["group_name"],
@@ -2289,7 +2294,7 @@ class StatsService:
         )
 
         # Cache for 1 hour
-        await self.cache.set(cache_key, response.model_dump(mode='json'), ttl=3600)
+        self.cache.set_async(cache_key, response.model_dump(mode='json'), ttl=3600)
 
         return response
 
@@ -2499,7 +2504,7 @@ class StatsService:
         )
 
         # Cache for 1 hour
-        await self.cache.set(cache_key, response.model_dump(mode='json'), ttl=3600)
+        self.cache.set_async(cache_key, response.model_dump(mode='json'), ttl=3600)
 
         return response
 
@@ -2773,7 +2778,7 @@ class StatsService:
         )
 
         # Cache for 1 hour
-        await self.cache.set(cache_key, response.model_dump(mode='json'), ttl=3600)
+        self.cache.set_async(cache_key, response.model_dump(mode='json'), ttl=3600)
 
         return response
 
@@ -3479,7 +3484,7 @@ class StatsService:
         )
 
         # Cache for 1 hour
-        await self.cache.set(cache_key, response.model_dump(mode='json'), ttl=3600)
+        self.cache.set_async(cache_key, response.model_dump(mode='json'), ttl=3600)
 
         return response
 
@@ -4018,7 +4023,7 @@ class StatsService:
         )
 
         # Cache for 1 hour
-        await self.cache.set(cache_key, response.model_dump(mode='json'), ttl=3600)
+        self.cache.set_async(cache_key, response.model_dump(mode='json'), ttl=3600)
 
         return response
 
@@ -4454,7 +4459,7 @@ class StatsService:
         )
 
         # Cache for 1 hour
-        await self.cache.set(cache_key, response.model_dump(mode='json'), ttl=3600)
+        self.cache.set_async(cache_key, response.model_dump(mode='json'), ttl=3600)
 
         return response
 
@@ -131,19 +131,30 @@ class UserCacheService:
                 "updated_at": now,
             })
 
-        # Upsert records
+        # Drop the VNs that fell out of the current top 200 (a plain upsert left
+        # them behind as stale rows, so each user's slice of the cache kept
+        # growing), then upsert the rest. Upserting rather than inserting keeps
+        # overlapping requests for the same user (another tab or method, both
+        # fired as background tasks) from failing on the (user_id, vn_id) key.
+        await self.db.execute(
+            delete(UserRecommendationCache).where(
+                UserRecommendationCache.user_id == user_id,
+                not_in_ids(UserRecommendationCache.vn_id, [r["vn_id"] for r in records]),
+            )
+        )
         stmt = insert(UserRecommendationCache).values(records)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["user_id", "vn_id"],
-            set_={
-                "combined_score": stmt.excluded.combined_score,
-                "tag_score": stmt.excluded.tag_score,
-                "cf_score": stmt.excluded.cf_score,
-                "hgat_score": stmt.excluded.hgat_score,
-                "updated_at": stmt.excluded.updated_at,
-            }
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "vn_id"],
+                set_={
+                    "combined_score": stmt.excluded.combined_score,
+                    "tag_score": stmt.excluded.tag_score,
+                    "cf_score": stmt.excluded.cf_score,
+                    "hgat_score": stmt.excluded.hgat_score,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
         )
-        await self.db.execute(stmt)
         await self.db.commit()
 
         logger.info(f"Cached {len(records)} recommendations for user {user_id}")
@@ -479,7 +479,7 @@ async def main():
     from app.services.vn_of_the_day_service import run_vn_of_the_day_selection
     from app.services.word_of_the_day_service import run_word_of_the_day_selection
     from app.services.hikaru_import import run_import as run_hikaru_import, is_enabled as hikaru_import_enabled
-    from app.logging.cleanup import cleanup_old_logs
+    from app.logging.cleanup import cleanup_old_logs, create_log_partitions
 
     scheduler = AsyncIOScheduler(
         timezone=timezone.utc,
@@ -570,6 +570,17 @@ async def main():
     else:
         logger.info("Scheduler not started (DEV_MODE=true)")
 
+    # Upcoming app_logs partitions - 02:30 UTC daily. Not gated by DEV_MODE:
+    # dev databases log too, and without this they run past the pre-created
+    # partitions into app_logs_default.
+    scheduler.add_job(
+        create_log_partitions,
+        CronTrigger(hour=2, minute=30),
+        id="app_logs_partitions",
+        replace_existing=True,
+    )
+    logger.info("App logs partition creation scheduled: 02:30 UTC daily")
+
     # Hikaru -> calendar import. Not gated by DEV_MODE (we want it in dev too);
     # only active when HIKARU_DB_PATH + VNCR_GUILD_ID are configured.
     if hikaru_import_enabled():
@@ -604,6 +615,9 @@ async def main():
         except Exception as e:
             logger.warning(f"Startup Word of the Day check failed: {e}")
 
+    # Startup partition check, so a worker started after a gap catches up
+    await create_log_partitions()
+
     # Startup hikaru import (runs in dev + prod when configured)
     if hikaru_import_enabled():
         try:
@@ -0,0 +1,74 @@
+"""Tests for the DB log handler's batch preparation (no database needed)."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+# app.logging's package __init__ also loads the Discord handler (httpx);
+# the minimal unit venv omits it, so skip there.
+pytest.importorskip("httpx")
+
+from app.logging.db_handler import _app_log_row, _fold_by_error_hash
+
+
+def _entry(error_hash, seconds, message="boom"):
+    return {
+        "timestamp": datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=seconds),
+        "level": "ERROR",
+        "source": "frontend",
+        "module": "Grid",
+        "message": message,
+        "error_hash": error_hash,
+    }
+
+
+def test_fold_collapses_repeats_of_a_hash():
+    grouped = _fold_by_error_hash([
+        _entry(b"a", 5, message="first"),
+        _entry(b"b", 1),
+        _entry(b"a", 9),
+        _entry(b"a", 2),
+    ])
+
+    assert set(grouped) == {b"a", b"b"}
+    a = grouped[b"a"]
+    assert a["message"] == "first"
+    assert a["occurrence_count"] == 3
+    assert a["first_seen"] == _entry(b"a", 2)["timestamp"]
+    assert a["last_seen"] == _entry(b"a", 9)["timestamp"]
+    assert grouped[b"b"]["occurrence_count"] == 1
+
+
+def test_fold_does_not_mutate_queued_entries():
+    # Failed flushes requeue the original entries, so folding must copy
+    entries = [_entry(b"a", 0), _entry(b"a", 1)]
+    _fold_by_error_hash(entries)
+    assert "occurrence_count" not in entries[0]
+
+
+def test_app_log_row_has_uniform_keys():
+    backend = _app_log_row({
+        "timestamp": datetime.now(timezone.utc),
+        "level": "INFO",
+        "source": "backend",
+        "module": "app.main",
+        "message": "x" * 6000,
+    })
+    frontend = _app_log_row(_fold_by_error_hash([_entry(b"a", 0)])[b"a"])
+
+    assert backend.keys() == frontend.keys()
+    assert len(backend["message"]) == 5000
+    assert backend["occurrence_count"] == 1
+    assert backend["error_hash"] is None
+
+
+def test_fold_adds_up_already_folded_entries():
+    # A retried flush requeues entries that were folded in the worker; they
+    # can come back after newer reports of the same hash
+    folded = _fold_by_error_hash([_entry(b"a", 3), _entry(b"a", 7)])[b"a"]
+    grouped = _fold_by_error_hash([_entry(b"a", 5), folded])
+
+    a = grouped[b"a"]
+    assert a["occurrence_count"] == 3
+    assert a["first_seen"] == _entry(b"a", 3)["timestamp"]
+    assert a["last_seen"] == _entry(b"a", 7)["timestamp"]
@@ -0,0 +1,105 @@
+"""Tests for the retry/backoff helpers in app/core/retry.py."""
+
+import pytest
+
+# retry.py classifies httpx errors; the minimal unit venv omits httpx, so skip there.
+pytest.importorskip("httpx")
+
+from app.core import retry as r
+
+
+def test_backoff_caps_are_exponential_and_capped():
+    config = r.RetryConfig(max_attempts=6, base_delay=1.0, max_delay=10.0)
+    assert r.backoff_caps(config) == (1.0, 2.0, 4.0, 8.0, 10.0)
+
+
+def test_backoff_caps_empty_for_single_attempt():
+    assert r.backoff_caps(r.RetryConfig(max_attempts=1)) == ()
+
+
+def test_calculate_delay_uses_full_jitter_range():
+    # Full jitter draws from [0, cap): delays must never exceed the cap and must
+    # spread well below it, unlike the old +/-10% window.
+    config = r.RetryConfig(base_delay=1.0, max_delay=60.0)
+    delays = [r.calculate_delay(2, config) for _ in range(500)]
+    assert all(0.0 <= d < 4.0 for d in delays)
+    assert min(delays) < 3.6
+
+
+def test_is_retryable_exception_by_type_and_status():
+    import httpx
+
+    config = r.RetryConfig()
+    assert r.is_retryable_exception(ConnectionError(), config)
+    assert not r.is_retryable_exception(ValueError(), config)
+
+    request = httpx.Request("GET", "https://example.invalid")
+    server_error = httpx.HTTPStatusError(
+        "boom", request=request, response=httpx.Response(503, request=request)
+    )
+    client_error = httpx.HTTPStatusError(
+        "nope", request=request, response=httpx.Response(404, request=request)
+    )
+    assert r.is_retryable_exception(server_error, config)
+    assert not r.is_retryable_exception(client_error, config)
+
+
+def test_retry_budget_refuses_retries_once_drained():
+    budget = r.RetryBudget(capacity=10.0, retry_cost=5.0, refill_rate=0.0)
+    assert budget.acquire()
+    assert budget.acquire()
+    assert not budget.acquire()
+
+    # A retried call that finally succeeds hands its tokens back.
+    budget.release()
+    assert budget.acquire()
+
+
+def test_async_retry_stops_when_budget_exhausted():
+    import asyncio
+
+    scope = "test_async_retry_stops_when_budget_exhausted"
+    r._budgets[scope] = r.RetryBudget(capacity=5.0, retry_cost=5.0, refill_rate=0.0)
+    calls = 0
+
+    @r.async_retry(r.RetryConfig(max_attempts=5, base_delay=0.0, budget_scope=scope))
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(flaky())
+    # One attempt, one budgeted retry, then fail fast instead of 5 attempts.
+    assert calls == 2
+
+
+def test_retry_context_requires_a_budget_scope():
+    with pytest.raises(ValueError):
+        r.RetryContext(r.RetryConfig())
+
+
+def test_retry_context_refunds_every_retry_it_spent():
+    import asyncio
+
+    scope = "test_retry_context_refunds_every_retry_it_spent"
+    budget = r._budgets[scope] = r.RetryBudget(
+        capacity=20.0, retry_cost=5.0, refill_rate=0.0
+    )
+    config = r.RetryConfig(max_attempts=4, base_delay=0.0, budget_scope=scope)
+
+    async def run():
+        failures = 2
+        async with r.RetryContext(config) as ctx:
+            while ctx.should_retry():
+                try:
+                    if failures:
+                        failures -= 1
+                        raise ConnectionError("down")
+                    break
+                except ConnectionError as e:
+                    await ctx.handle_exception(e)
+
+    asyncio.run(run())
+    # Two retries spent 10 tokens; succeeding refunds both, not just one.
+    assert budget.tokens == 20.0
@@ -0,0 +1,95 @@
+"""Tests for the VNDB client's local flow control (rate limiter, circuit breaker).
+
+Pure in-process state machines: no network calls are made.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+# vndb_client imports httpx and the pydantic settings; the minimal unit venv
+# omits both, so skip there.
+pytest.importorskip("httpx")
+pytest.importorskip("pydantic_settings")
+
+from app.core.vndb_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimiter,
+    parse_retry_after,
+)
+
+
+def test_rate_limiter_allows_burst_up_to_capacity():
+    async def run():
+        limiter = RateLimiter(max_requests=5, window_seconds=300)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(5):
+            await limiter.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(run()) < 0.05
+
+
+def test_rate_limiter_waits_for_refill_when_empty():
+    async def run():
+        # 10 tokens/second: the 3rd request must wait ~0.1s for a refill.
+        limiter = RateLimiter(max_requests=2, window_seconds=0.2)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(3):
+            await limiter.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_rate_limiter_penalize_blocks_until_retry_after():
+    async def run():
+        limiter = RateLimiter(max_requests=100, window_seconds=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        limiter.penalize(0.1)
+        await limiter.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(run()) >= 0.1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) == 1.0
+    assert parse_retry_after("garbage", default=2.0) == 2.0
+    # HTTP-dates in the past clamp to zero rather than going negative.
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_circuit_breaker_opens_then_probes():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=0.05)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    time.sleep(0.06)
+    breaker.before_call()  # the single half-open probe
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=0.01)
+    breaker.before_call()
+    breaker.record_failure()
+    time.sleep(0.02)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN